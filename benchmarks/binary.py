@@ -0,0 +1,93 @@
+"""Benchmark MessagePack serialization against JSON, with and without native binary representations. Requires msgpack.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.binary
+```
+"""
+
+import argparse
+import datetime
+import struct
+import timeit
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from benchmarks.models import Event, dump_point, dump_timestamp, event_payload
+from pydantic_custom_type_adapter import PydanticAdapter
+from pydantic_custom_type_adapter.msgpack import dump_msgpack, validate_msgpack
+from tests.custom_types import Point, Timestamp
+
+
+def parse_point_binary(data: bytes) -> Point:
+    return Point(*struct.unpack("<2d", data))
+
+
+def dump_point_binary(point: Point) -> bytes:
+    return struct.pack("<2d", point.x, point.y)
+
+
+def dump_timestamp_binary(timestamp: Timestamp) -> datetime.datetime:
+    return timestamp.datetime
+
+
+class Reading(BaseModel):
+    positions: list[
+        Annotated[
+            Point,
+            PydanticAdapter(
+                type=Point,
+                parse=Point.from_dict,
+                dump=dump_point,
+                parse_binary=parse_point_binary,
+                dump_binary=dump_point_binary,
+            ),
+        ]
+    ]
+    timestamp: Annotated[
+        Timestamp,
+        PydanticAdapter(
+            type=Timestamp,
+            parse=Timestamp.parse,
+            dump=dump_timestamp,
+            parse_binary=Timestamp,
+            dump_binary=dump_timestamp_binary,
+        ),
+    ]
+
+
+def bench(name: str, model: BaseModel, number: int, repeat: int) -> None:
+    cls = type(model)
+    json_data = model.model_dump_json()
+    msgpack_data = dump_msgpack(model)
+    results = {
+        "dump json": lambda: model.model_dump_json(),
+        "dump msgpack": lambda: dump_msgpack(model),
+        "validate json": lambda: cls.model_validate_json(json_data),
+        "validate msgpack": lambda: validate_msgpack(cls, msgpack_data),
+    }
+    print(f"{name} (json {len(json_data)} B, msgpack {len(msgpack_data)} B)")
+    for label, func in results.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(f"  {label:>16}: {seconds / number * 1e6:>8.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    reading = Reading(
+        positions=[Point(i * 0.1, i * 0.2) for i in range(100)],
+        timestamp=Timestamp(now),
+    )
+    bench("Event", Event.model_validate(event_payload(1)), args.number, args.repeat)
+    bench("Reading (binary adapters)", reading, args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
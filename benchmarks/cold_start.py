@@ -0,0 +1,131 @@
+"""Benchmark the cold start of a worker process with and without a `SchemaCache`.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.cold_start
+```
+
+Each run starts a new process which imports models created with `defer_build=True` and validates one payload with it, either building the model as usual or loading its schema from the cache. Only the time from after the import to the end of the validation is measured.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+from benchmarks.models import (
+    CoordinatesType,
+    EmailType,
+    PointType,
+    SafeStringType,
+    TimestampType,
+    TreeNodeType,
+    UserIdType,
+    event_payload,
+)
+
+
+class Account(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    id: UserIdType
+    username: SafeStringType
+    email: EmailType
+    backup_email: EmailType | None = None
+
+
+class Activity(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    account: Account
+    position: PointType
+    path: list[PointType]
+    coordinates: CoordinatesType
+    visited: dict[str, CoordinatesType]
+    started: TimestampType
+    finished: TimestampType | None = None
+    tree: TreeNodeType
+    tags: list[str] = []
+
+
+# A wide model of optional adapted fields, standing in for the many models of an application
+_journal_fields: dict[str, Any] = {
+    f"{name}{i}": (annotation | None, None)
+    for i in range(20)
+    for name, annotation in {
+        "id": UserIdType,
+        "username": SafeStringType,
+        "email": EmailType,
+        "position": PointType,
+        "coordinates": CoordinatesType,
+        "timestamp": TimestampType,
+        "tree": TreeNodeType,
+    }.items()
+}
+Journal = create_model(
+    "Journal",
+    __config__=ConfigDict(defer_build=True),
+    __module__=__name__,
+    activity=(Activity, ...),
+    **_journal_fields,
+)
+
+
+def payload() -> dict[str, object]:
+    event = event_payload(0)
+    activity = {
+        "name": event["name"],
+        "account": event["user"],
+        "position": event["position"],
+        "path": [event["position"]] * 3,
+        "coordinates": event["coordinates"],
+        "visited": {"home": event["coordinates"]},
+        "started": event["timestamp"],
+        "tree": event["tree"],
+    }
+    return {"activity": activity, "email0": "user0@example.com"}
+
+
+def child(directory: str | None) -> None:
+    start = time.perf_counter()
+    if directory is None:
+        Journal.model_validate(payload())
+    else:
+        from pydantic_custom_type_adapter.cache import SchemaCache
+
+        validator, _ = SchemaCache(directory, version="benchmark").load(Journal)
+        validator.validate_python(payload())
+    print(time.perf_counter() - start)
+
+
+def run(directory: str | None) -> float:
+    # The models are imported from their module rather than run as __main__
+    code = f"from benchmarks.cold_start import child; child({directory!r})"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        run(directory)  # Populate the cache
+        build = statistics.median(run(None) for _ in range(args.repeat))
+        cached = statistics.median(run(directory) for _ in range(args.repeat))
+    print(f"build:  {build * 1e3:>8.2f} ms")
+    print(f"cached: {cached * 1e3:>8.2f} ms  ({build / cached:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark dumping models into columns with `dump_columns` against dumping them row by row.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.columns
+```
+"""
+
+import argparse
+import timeit
+
+from benchmarks.models import Event, event_payload
+from pydantic_custom_type_adapter import dump_columns, validate_columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    events = [Event.model_validate(event_payload(i)) for i in range(args.records)]
+    rows = [event.model_dump() for event in events]
+    columns = dump_columns(events)
+
+    def rows_dump() -> None:
+        rows = [event.model_dump() for event in events]
+        {key: [row[key] for row in rows] for key in rows[0]}
+
+    def rows_validate() -> None:
+        [Event.model_validate(row) for row in rows]
+
+    results = {
+        "dump rows": min(timeit.repeat(rows_dump, number=1, repeat=args.repeat)),
+        "dump_columns": min(
+            timeit.repeat(lambda: dump_columns(events), number=1, repeat=args.repeat)
+        ),
+        "validate rows": min(
+            timeit.repeat(rows_validate, number=1, repeat=args.repeat)
+        ),
+        "validate_columns": min(
+            timeit.repeat(
+                lambda: validate_columns(Event, columns), number=1, repeat=args.repeat
+            )
+        ),
+    }
+    for name, seconds in results.items():
+        print(f"{name + ':':<18}{args.records / seconds:>10.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
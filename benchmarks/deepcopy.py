@@ -0,0 +1,64 @@
+"""Benchmark deep-copying models with large custom values, with and without a copy policy.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.deepcopy
+```
+
+Copy policies are set on the custom types themselves, for the whole process, so the default deep copies are timed first. Then the frozen `Coordinates` are shared, and the mutable `TreeNode`s are cloned by a function which copies the tree directly, without the bookkeeping of `copy.deepcopy`.
+"""
+
+import argparse
+import timeit
+
+from benchmarks.models import Event, event_payload
+from pydantic_custom_type_adapter import set_copy_policy
+from tests.custom_types import Coordinates, TreeNode
+
+
+def clone(node: TreeNode) -> TreeNode:
+    return TreeNode(node.value, [clone(child) for child in node.children])
+
+
+def tree(depth: int, width: int) -> dict[str, object]:
+    if depth == 0:
+        return {"value": "leaf"}
+    return {
+        "value": f"node{depth}",
+        "children": [tree(depth - 1, width) for _ in range(width)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    events = [
+        Event.model_validate({**event_payload(i), "tree": tree(args.depth, args.width)})
+        for i in range(args.records)
+    ]
+
+    def run() -> None:
+        for event in events:
+            event.model_copy(deep=True)
+
+    default = min(timeit.repeat(run, number=1, repeat=args.repeat))
+
+    set_copy_policy(Coordinates, immutable=True)
+    set_copy_policy(TreeNode, copy=clone)
+    policies = min(timeit.repeat(run, number=1, repeat=args.repeat))
+
+    print(f"default:  {args.records / default:>10.0f} copies/s")
+    print(
+        f"policies: {args.records / policies:>10.0f} copies/s"
+        f"  ({default / policies:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
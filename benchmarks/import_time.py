@@ -0,0 +1,62 @@
+"""Measure the time it takes to import the package, and check it against a budget.
+
+Pydantic is imported first, since any user of the package pays for it anyway, so only the package's own import time is measured. The measurement uses `python -X importtime`, taking the best of several runs after a warm-up run which writes the bytecode cache. Exits with status 1 if the import time exceeds the budget.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.import_time --budget-ms 2
+```
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+PACKAGE = "pydantic_custom_type_adapter"
+
+
+def import_time_us() -> int:
+    """Import the package in a fresh interpreter and return its cumulative import time in microseconds."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import pydantic_core; from pydantic import BaseModel; import {PACKAGE}",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package", among any warnings printed by the interpreter
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == PACKAGE:
+            return int(cumulative)
+    raise RuntimeError(f"{PACKAGE} not found in the import time report")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    import_time_us()  # warm up the bytecode cache
+    times = sorted(import_time_us() for _ in range(args.runs))
+    best, median = times[0] / 1000, times[len(times) // 2] / 1000
+    print(f"import {PACKAGE}: best {best:.2f} ms, median {median:.2f} ms")
+    if best > args.budget_ms:
+        print(f"Over the budget of {args.budget_ms:.2f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Models and payloads shared by the benchmarks, built from `tests.custom_types`."""
+
+import datetime
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from tests.custom_types import (
+    Coordinates,
+    Email,
+    Point,
+    SafeString,
+    Timestamp,
+    TreeNode,
+    UserId,
+)
+
+
+def dump_user_id(user_id: UserId) -> int:
+    return user_id.id
+
+
+def dump_point(point: Point) -> dict[str, float]:
+    return point.to_dict()
+
+
+def dump_safe_string(safe_string: SafeString) -> str:
+    return safe_string.value
+
+
+def dump_timestamp(timestamp: Timestamp) -> dict[str, object]:
+    return timestamp.to_dict()
+
+
+def dump_coordinates(coordinates: Coordinates) -> str:
+    return coordinates.to_string()
+
+
+def dump_tree_node(tree_node: TreeNode) -> dict[str, object]:
+    return tree_node.to_dict()
+
+
+EmailType = Annotated[
+    Email,
+    PydanticAdapter(type=Email, parse=Email.parse, dump=str, construct=Email.unchecked),
+]
+UserIdType = Annotated[
+    UserId, PydanticAdapter(type=UserId, parse=UserId.parse, dump=dump_user_id)
+]
+PointType = Annotated[
+    Point, PydanticAdapter(type=Point, parse=Point.from_dict, dump=dump_point)
+]
+SafeStringType = Annotated[
+    SafeString,
+    PydanticAdapter(
+        type=SafeString,
+        parse=SafeString.parse,
+        dump=dump_safe_string,
+        construct=SafeString.unchecked,
+    ),
+]
+TimestampType = Annotated[
+    Timestamp,
+    PydanticAdapter(type=Timestamp, parse=Timestamp.parse, dump=dump_timestamp),
+]
+CoordinatesType = Annotated[
+    Coordinates,
+    PydanticAdapter(
+        type=Coordinates, parse=Coordinates.from_string, dump=dump_coordinates
+    ),
+]
+TreeNodeType = Annotated[
+    TreeNode,
+    PydanticAdapter(type=TreeNode, parse=TreeNode.from_dict, dump=dump_tree_node),
+]
+
+
+class User(BaseModel):
+    id: UserIdType
+    username: SafeStringType
+    email: EmailType
+
+
+class Event(BaseModel):
+    name: str
+    user: User
+    position: PointType
+    coordinates: CoordinatesType
+    timestamp: TimestampType
+    tree: TreeNodeType
+
+
+def event_payload(i: int) -> dict[str, object]:
+    """A JSON-compatible payload for an `Event`, varied by `i`."""
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "name": f"event{i}",
+        "user": {"id": i + 1, "username": f"user{i}", "email": f"user{i}@example.com"},
+        "position": {"x": i * 0.5, "y": i * 1.5},
+        "coordinates": f"{i % 90}.25,{i % 180}.75",
+        "timestamp": Timestamp(now + datetime.timedelta(seconds=i)).to_dict(),
+        "tree": {
+            "value": "root",
+            "children": [
+                {"value": f"child{j}", "children": [{"value": "leaf"}]}
+                for j in range(3)
+            ],
+        },
+    }
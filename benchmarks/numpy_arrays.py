@@ -0,0 +1,82 @@
+"""Benchmark JSON round-trips of a large NumPy array in each format of `NDArrayAdapter`.
+
+A hand-written adapter which converts the array to and from a list item by item is included for comparison. Requires NumPy.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.numpy_arrays --size 1000000
+```
+"""
+
+import argparse
+import timeit
+from typing import Annotated, Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from pydantic_custom_type_adapter.numpy import NDArrayAdapter
+
+
+def parse_by_item(value: list[float]) -> np.ndarray:
+    array = np.empty(len(value), dtype=np.float64)
+    for i, item in enumerate(value):
+        array[i] = float(item)
+    return array
+
+
+def dump_by_item(array: np.ndarray) -> list[float]:
+    return [float(item) for item in array]
+
+
+def model_for(adapter: Any) -> type[BaseModel]:
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, adapter]
+
+    return Sample
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    array = np.random.default_rng(0).random(args.size)
+    adapters = {
+        "by item": PydanticAdapter(
+            type=np.ndarray, parse=parse_by_item, dump=dump_by_item
+        ),
+        **{
+            format: NDArrayAdapter(dtype=np.float64, format=format)
+            for format in ("list", "flat", "base64")
+        },
+    }
+
+    for name, adapter in adapters.items():
+        model = model_for(adapter)
+        json_data = model(values=array).model_dump_json()
+        dump = min(
+            timeit.repeat(
+                lambda: model(values=array).model_dump_json(),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        validate = min(
+            timeit.repeat(
+                lambda: model.model_validate_json(json_data),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{name:>8}: dump {dump * 1000:>8.1f} ms, validate {validate * 1000:>8.1f} ms,"
+            f" {len(json_data) / 1e6:>6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark validation and serialization throughput across threads.
+
+Each thread repeatedly validates `Event` payloads from JSON and dumps them back to JSON. On a free-threaded (PEP 703) build of CPython the throughput should scale with the number of threads, since `PydanticAdapter` holds no shared mutable state. On a regular build the GIL serializes the Python callbacks, so expect roughly flat throughput.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.threads --threads 1 2 4 8 --iterations 2000
+```
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from pydantic_core import to_json
+
+from benchmarks.models import Event, event_payload
+
+
+def _work(payloads: list[bytes], iterations: int, barrier: threading.Barrier) -> None:
+    barrier.wait()
+    for i in range(iterations):
+        event = Event.model_validate_json(payloads[i % len(payloads)])
+        event.model_dump_json()
+
+
+def run(threads: int, iterations: int, payloads: list[bytes]) -> float:
+    """Return the combined validate+dump throughput, in records per second."""
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=_work, args=(payloads, iterations, barrier))
+        for _ in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}"
+    )
+
+    payloads = [to_json(event_payload(i)) for i in range(64)]
+    run(1, args.iterations // 10 or 1, payloads)  # warm up
+
+    baseline = None
+    for threads in args.threads:
+        throughput = run(threads, args.iterations, payloads)
+        baseline = baseline or throughput
+        print(
+            f"{threads:>3} threads: {throughput:>10.0f} records/s"
+            f"  ({throughput / baseline:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
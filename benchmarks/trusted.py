@@ -0,0 +1,103 @@
+"""Benchmark validating trusted input with `construct` against validating it with `parse`.
+
+Run from the repository root:
+
+```sh
+$ python -m benchmarks.trusted
+```
+
+Untrusted validation is measured both for a model whose adapters have no `construct` function and for the same model with `construct`, which should be just as fast. The email addresses are validated like real email types do, with a regular expression and by normalizing the domain, since the checks of the test types are cheaper than the call to `construct` which replaces them.
+"""
+
+import argparse
+import re
+import timeit
+from typing import Annotated, Self
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from benchmarks.models import SafeStringType, UserIdType
+from pydantic_custom_type_adapter import PydanticAdapter, validate_trusted_json
+
+_ADDRESS = re.compile(
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+"
+    r"@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+"
+)
+
+
+class Address:
+    """An email address, checked and normalized when parsed."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        if _ADDRESS.fullmatch(value) is None:
+            raise ValueError("Invalid email address")
+        local, _, domain = value.rpartition("@")
+        return cls(f"{local}@{domain.encode('idna').decode('ascii').lower()}")
+
+
+class PlainUser(BaseModel):
+    id: UserIdType
+    username: SafeStringType
+    email: Annotated[
+        Address, PydanticAdapter(type=Address, parse=Address.parse, dump=str)
+    ]
+
+
+class User(BaseModel):
+    id: UserIdType
+    username: SafeStringType
+    email: Annotated[
+        Address,
+        PydanticAdapter(type=Address, parse=Address.parse, dump=str, construct=Address),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    payloads = [
+        to_json({"id": i + 1, "username": f"user{i}", "email": f"user{i}@example.com"})
+        for i in range(args.records)
+    ]
+
+    def plain_run() -> None:
+        for payload in payloads:
+            PlainUser.model_validate_json(payload)
+
+    def untrusted_run() -> None:
+        for payload in payloads:
+            User.model_validate_json(payload)
+
+    def trusted_run() -> None:
+        for payload in payloads:
+            validate_trusted_json(User, payload)
+
+    results = {
+        "parse, no construct": plain_run,
+        "parse": untrusted_run,
+        "construct": trusted_run,
+    }
+    baseline = None
+    for name, run in results.items():
+        seconds = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(
+            f"{name + ':':<21}{args.records / seconds:>10.0f} records/s"
+            f"  ({baseline / seconds:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,51 +2,56 @@
 .. include:: ../README.md
 """
 
-import importlib.metadata as metadata
-from typing import Callable
-
-from pydantic_core import core_schema
-
-__version__ = metadata.version(__package__ or __name__)
-
-
-class PydanticAdapter[T, J]:
-    """A Pydantic adapter for a custom type.
-
-    This class allows you to use custom types with pydantic by providing functions to convert between your custom type and some JSON-compatible type, such as a string or a number.
-
-    It is useful when you want to use a custom type in a Pydantic model and need to define how to serialize and deserialize that type.
-
-    Example:
-        ```python
-        from typing import Annotated
-        from pydantic import BaseModel
-        from some_module import CustomType
-        from pydantic_custom_type_adapter import PydanticAdapter
-
-        CustomTypeAnnotation = Annotated[CustomType, PydanticAdapter(CustomType, parse=CustomType.parse, dump=str)]
-
-        class MyModel(BaseModel):
-            custom_field: CustomTypeAnnotation
-        ```
-    Args:
-        type: The type of the custom object.
-        parse: A function that takes a JSON value and returns an instance of the custom type. The function should raise a ValueError if the value cannot be converted to the custom type, either because it is of the wrong type entirely or because it is not a valid value for the custom type.
-        dump: A function that takes an instance of the custom type and returns a JSON value. The value returned should be a valid input for the `parse` function.
-    """
-
-    def __init__(
-        self, type: type[T], *, parse: Callable[[J], T], dump: Callable[[T], J]
-    ) -> None:
-        self._type = type
-        self._parse = parse
-        self._dump = dump
-
-    def __get_pydantic_core_schema__(self, *_: object) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(self._type),
-                core_schema.no_info_plain_validator_function(self._parse),
-            ],
-            serialization=core_schema.plain_serializer_function_ser_schema(self._dump),
-        )
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ._adapter import PydanticAdapter
+
+if TYPE_CHECKING:
+    from ._async import avalidate, avalidate_json
+    from ._columns import dump_columns, validate_columns
+    from ._copy import set_copy_policy
+    from ._parallel import validate_many_parallel
+    from ._trusted import validate_trusted, validate_trusted_json
+
+# Attributes imported from their modules only when first accessed, to keep importing this package cheap
+_LAZY_ATTRIBUTES = {
+    "avalidate": "._async",
+    "avalidate_json": "._async",
+    "dump_columns": "._columns",
+    "validate_columns": "._columns",
+    "set_copy_policy": "._copy",
+    "validate_many_parallel": "._parallel",
+    "validate_trusted": "._trusted",
+    "validate_trusted_json": "._trusted",
+}
+
+__all__ = [
+    "PydanticAdapter",
+    "avalidate",
+    "avalidate_json",
+    "dump_columns",
+    "set_copy_policy",
+    "validate_columns",
+    "validate_many_parallel",
+    "validate_trusted",
+    "validate_trusted_json",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib import metadata
+
+        value = metadata.version(__package__ or __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "__version__"})
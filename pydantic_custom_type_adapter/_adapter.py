@@ -0,0 +1,340 @@
+import builtins
+import importlib
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping, Sequence
+
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+
+# The validation context key under which `avalidate` passes its resolutions to the adapters.
+_RESOLUTIONS_CONTEXT_KEY = "pydantic_custom_type_adapter.resolutions"
+
+# The context key which tells adapters to use their binary representation, if they have one.
+_BINARY_CONTEXT_KEY = "pydantic_custom_type_adapter.binary"
+
+# The core schema metadata key which marks the schema of an adapter, holding the adapter itself.
+_ADAPTER_METADATA_KEY = "pydantic_custom_type_adapter.adapter"
+
+
+def _import_path(path: str) -> Any:
+    """Import an object given its path, such as `package.module:Class.method`.
+
+    The module may also be separated from the attribute path by a dot instead of a colon, in which case the longest importable prefix is used as the module.
+    """
+    if ":" in path:
+        module_name, _, qualname = path.partition(":")
+        candidates = [(module_name, qualname.split("."))]
+    else:
+        parts = path.split(".")
+        candidates = [
+            (".".join(parts[:i]), parts[i:]) for i in range(len(parts) - 1, 0, -1)
+        ]
+    for module_name, attrs in candidates:
+        try:
+            obj = importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name and f"{module_name}.".startswith(f"{e.name}."):
+                continue
+            raise
+        try:
+            for attr in attrs:
+                obj = getattr(obj, attr)
+        except AttributeError as e:
+            raise ImportError(f"Could not import {path!r}: {e}") from e
+        return obj
+    raise ImportError(f"Could not import {path!r}")
+
+
+def _resolve_ref[F](ref: F | str) -> F:
+    return _import_path(ref) if isinstance(ref, str) else ref
+
+
+def _shadow(cls: type) -> type:
+    """A subclass of a model or dataclass which pydantic-core builds from a modified copy of its schema.
+
+    Pydantic-core reuses the existing validator and serializer of a complete model or dataclass instead of building them from the schema, so the schema refers to this subclass instead. It is created without running the metaclass of the original class, which would build its schema again.
+    """
+    namespace = {
+        "__pydantic_complete__": False,
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+    }
+    return type.__new__(type(cls), cls.__name__, (cls,), namespace)
+
+
+class PydanticAdapter[T, J]:
+    """A Pydantic adapter for a custom type.
+
+    This class allows you to use custom types with pydantic by providing functions to convert between your custom type and some JSON-compatible type, such as a string or a number.
+
+    It is useful when you want to use a custom type in a Pydantic model and need to define how to serialize and deserialize that type.
+
+    Adapters are thread-safe, including on free-threaded (PEP 703) builds of CPython. An adapter holds no mutable state after construction, so the same adapter (and the models using it) may validate and serialize from any number of threads concurrently without locking. The `parse` and `dump` functions you provide are called concurrently too, so they must be thread-safe themselves.
+
+    Example:
+        ```python
+        from typing import Annotated
+        from pydantic import BaseModel
+        from some_module import CustomType
+        from pydantic_custom_type_adapter import PydanticAdapter
+
+        CustomTypeAnnotation = Annotated[CustomType, PydanticAdapter(CustomType, parse=CustomType.parse, dump=str)]
+
+        class MyModel(BaseModel):
+            custom_field: CustomTypeAnnotation
+        ```
+
+    For input known to be valid, such as data your own code produced, an adapter may be given a `construct` function which builds the custom type without validating its input. It is used instead of `parse` when the adapter is created with `trusted=True`, or when validating with `validate_trusted` or `validate_trusted_json`, which use a separate validator for the model so that validating untrusted input is as fast as without `construct`. Instances of the custom type are still passed through as is.
+
+    Adapters can be pickled as long as their `parse` and `dump` functions can be. Since lambdas cannot be pickled, `parse` and `dump` may instead be given as import paths such as `"some_module:CustomType.parse"`, in which case the adapter is pickled by reference to those paths.
+
+    Args:
+        type: The type of the custom object.
+        parse: A function that takes a JSON value and returns an instance of the custom type. The function should raise a ValueError if the value cannot be converted to the custom type, either because it is of the wrong type entirely or because it is not a valid value for the custom type. May also be the import path of such a function.
+        dump: A function that takes an instance of the custom type and returns a JSON value. The value returned should be a valid input for the `parse` function. May also be the import path of such a function.
+        aparse: An optional coroutine function like `parse`, for types which need I/O to be resolved, such as looking up an ID in a service. It is used instead of `parse` when validating with `avalidate` or `avalidate_json`, which resolve all the values in a payload concurrently. May also be the import path of such a function.
+        construct: An optional function like `parse` which assumes its input is valid and skips any checks, used for trusted input. May also be the import path of such a function.
+        trusted: Whether all input to this adapter is trusted, so that `construct` is always used instead of `parse`. Requires `construct`.
+        parse_binary: An optional function like `parse` which takes the value returned by `dump_binary`. It is used instead of `parse` by binary formats such as `pydantic_custom_type_adapter.msgpack`. May also be the import path of such a function.
+        dump_binary: An optional function like `dump` which returns a native binary representation of the custom type, such as `bytes`, for binary formats such as `pydantic_custom_type_adapter.msgpack`. This avoids formatting and parsing strings where the type has a more efficient binary form. May also be the import path of such a function.
+        input_type: An optional type which the input to `parse` must have, such as `str`. The input is validated as this type by pydantic before `parse` is called, so input of the wrong type is rejected without calling `parse`. Cannot be combined with `parse_binary`.
+        return_type: An optional type which `dump` returns, such as `str`. Pydantic then serializes the output of `dump` as this type, instead of inspecting it to find out how to serialize it. Cannot be combined with `dump_binary`.
+        parse_many: An optional vectorized version of `parse`, which takes a sequence of JSON values (or a NumPy array) and returns a sequence of instances of the custom type. It is used by `validate_columns` instead of calling `parse` for each value. May also be the import path of such a function.
+        dump_many: An optional vectorized version of `dump`, which takes a sequence of instances of the custom type and returns a sequence of JSON values (or a NumPy array). It is used by `dump_columns` instead of calling `dump` for each value. May also be the import path of such a function.
+    """
+
+    def __init__(
+        self,
+        type: type[T],
+        *,
+        parse: Callable[[J], T] | str,
+        dump: Callable[[T], J] | str,
+        aparse: Callable[[J], Awaitable[T]] | str | None = None,
+        construct: Callable[[J], T] | str | None = None,
+        trusted: bool = False,
+        parse_binary: Callable[[Any], T] | str | None = None,
+        dump_binary: Callable[[T], Any] | str | None = None,
+        input_type: Any = None,
+        return_type: Any = None,
+        parse_many: Callable[[Sequence[J]], Sequence[T]] | str | None = None,
+        dump_many: Callable[[Sequence[T]], Sequence[J]] | str | None = None,
+    ) -> None:
+        if trusted and construct is None:
+            raise ValueError("A trusted adapter requires a construct function")
+        if (parse_binary is None) != (dump_binary is None):
+            raise ValueError("parse_binary and dump_binary must be given together")
+        if dump_binary is not None and (
+            input_type is not None or return_type is not None
+        ):
+            raise ValueError(
+                "input_type and return_type cannot be combined with binary functions"
+            )
+        self._type = type
+        self._refs = {
+            "parse": parse,
+            "dump": dump,
+            "aparse": aparse,
+            "construct": construct,
+            "parse_binary": parse_binary,
+            "dump_binary": dump_binary,
+            "parse_many": parse_many,
+            "dump_many": dump_many,
+        }
+        self._parse: Callable[[J], T] = _resolve_ref(parse)
+        self._dump: Callable[[T], J] = _resolve_ref(dump)
+        self._aparse: Callable[[J], Awaitable[T]] | None = _resolve_ref(aparse)
+        self._construct: Callable[[J], T] | None = _resolve_ref(construct)
+        self._trusted = trusted
+        self._parse_binary: Callable[[Any], T] | None = _resolve_ref(parse_binary)
+        self._dump_binary: Callable[[T], Any] | None = _resolve_ref(dump_binary)
+        self._parse_many: Callable[[Sequence[J]], Sequence[T]] | None = _resolve_ref(
+            parse_many
+        )
+        self._dump_many: Callable[[Sequence[T]], Sequence[J]] | None = _resolve_ref(
+            dump_many
+        )
+        self._input_type = input_type
+        self._return_type = return_type
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "type": self._type,
+            **self._refs,
+            "trusted": self._trusted,
+            "input_type": self._input_type,
+            "return_type": self._return_type,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    @classmethod
+    def from_mapping(
+        cls, mapping: Mapping[J, T], *, type: type[T] | None = None
+    ) -> "PydanticAdapter[T, J]":
+        """Create an adapter for a type with a finite set of values, given the JSON value of each instance.
+
+        Validation accepts either one of the JSON values (the keys of `mapping`) or one of the instances themselves, and reports the allowed JSON values when the input is neither. JSON values are checked by pydantic-core and looked up in the mapping without calling a Python function for each value. Instances are checked by comparing them with those of the mapping, which calls their `__hash__` and `__eq__` methods, and an equal instance is replaced by the one in the mapping. Instances are dumped by a Python function which looks them up by identity, so only the instances of the mapping can be dumped.
+
+        Example:
+            ```python
+            REGIONS = {"us": Region("United States"), "eu": Region("European Union")}
+
+            RegionType = Annotated[Region, PydanticAdapter.from_mapping(REGIONS)]
+            ```
+
+        Args:
+            mapping: A mapping from each JSON value to the corresponding instance of the custom type. The JSON values must be strings, integers, booleans or None.
+            type: The type of the custom object. Defaults to the type of the instances, which must then all have the same type.
+        """
+        return _MappingAdapter(mapping, type=type)
+
+    async def aparse(self, value: J) -> T:
+        """Convert a JSON value to the custom type, awaiting `aparse` if it was given or calling `parse` otherwise."""
+        if self._aparse is None:
+            return self._parse(value)
+        return await self._aparse(value)
+
+    def _validate(self, value: J, info: core_schema.ValidationInfo) -> T:
+        if info.context is not None:
+            resolutions = info.context.get(_RESOLUTIONS_CONTEXT_KEY)
+            if resolutions is not None:
+                return resolutions.resolve(self, value)
+            if self._parse_binary is not None and info.context.get(_BINARY_CONTEXT_KEY):
+                return self._parse_binary(value)
+        if self._trusted:
+            return self._construct(value)  # type: ignore[misc]
+        return self._parse(value)
+
+    def _validator_schema(
+        self, input_schema: core_schema.CoreSchema | None, trusted: bool = False
+    ) -> core_schema.CoreSchema:
+        # Only look at the context when it can change the outcome, since functions without info are faster
+        if trusted or (self._aparse is None and self._parse_binary is None):
+            parse = self._construct if trusted or self._trusted else self._parse
+            if input_schema is None:
+                return core_schema.no_info_plain_validator_function(parse)  # type: ignore[arg-type]
+            return core_schema.no_info_after_validator_function(parse, input_schema)  # type: ignore[arg-type]
+        if input_schema is None:
+            return core_schema.with_info_plain_validator_function(self._validate)
+        return core_schema.with_info_after_validator_function(
+            self._validate, input_schema
+        )
+
+    def _serialize(self, value: T, info: core_schema.SerializationInfo) -> Any:
+        if info.context is not None and info.context.get(_BINARY_CONTEXT_KEY):
+            return self._dump_binary(value)  # type: ignore[misc]
+        return self._dump(value)
+
+    def _serialization_schema(
+        self, return_schema: core_schema.CoreSchema | None
+    ) -> core_schema.SerSchema:
+        if self._dump_binary is None:
+            return core_schema.plain_serializer_function_ser_schema(
+                self._dump, return_schema=return_schema
+            )
+        return core_schema.plain_serializer_function_ser_schema(
+            self._serialize, info_arg=True
+        )
+
+    def _core_schema(self, handler: "GetCoreSchemaHandler") -> core_schema.CoreSchema:
+        input_schema = (
+            None
+            if self._input_type is None
+            else handler.generate_schema(self._input_type)
+        )
+        return_schema = (
+            None
+            if self._return_type is None
+            else handler.generate_schema(self._return_type)
+        )
+        return core_schema.union_schema(
+            [
+                core_schema.is_instance_schema(self._type),
+                self._validator_schema(input_schema),
+            ],
+            serialization=self._serialization_schema(return_schema),
+        )
+
+    def _trusted_schema(self, schema: dict[str, Any]) -> core_schema.CoreSchema:
+        """A copy of the schema of this adapter which uses `construct` instead of `parse`, for `validate_trusted`."""
+        is_instance, validator = schema["choices"]
+        input_schema = (
+            validator["schema"] if validator["type"] == "function-after" else None
+        )
+        return {  # type: ignore[return-value]
+            **schema,
+            "choices": [
+                is_instance,
+                self._validator_schema(input_schema, trusted=True),
+            ],
+        }
+
+    def __get_pydantic_core_schema__(
+        self, _source: Any, handler: "GetCoreSchemaHandler"
+    ) -> core_schema.CoreSchema:
+        schema: dict[str, Any] = dict(self._core_schema(handler))
+        schema["metadata"] = {_ADAPTER_METADATA_KEY: self}
+        return schema
+
+
+class _MappingAdapter[T, J](PydanticAdapter[T, J]):
+    """An adapter for a finite set of values, created by `PydanticAdapter.from_mapping`."""
+
+    def __init__(self, mapping: Mapping[J, T], *, type: type[T] | None = None) -> None:
+        if not mapping:
+            raise ValueError("The mapping must not be empty")
+        instances = list(mapping.values())
+        if type is None:
+            type = builtins.type(instances[0])
+            if any(builtins.type(instance) is not type for instance in instances):
+                raise ValueError(
+                    "The instances must all have the same type, or it must be given"
+                )
+        self._mapping = dict(mapping)
+        # Keyed by identity, so that only the instances of the mapping are dumped, and without calling their __hash__ and __eq__
+        self._reverse = {
+            id(instance): value for value, instance in self._mapping.items()
+        }
+        super().__init__(type, parse=self._lookup, dump=self._reverse_lookup)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"mapping": self._mapping, "type": self._type}
+
+    def _lookup(self, value: J) -> T:
+        try:
+            return self._mapping[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Input should be {self._expected()}") from None
+
+    def _reverse_lookup(self, instance: T) -> J:
+        try:
+            return self._reverse[id(instance)]
+        except KeyError:
+            raise ValueError(
+                f"{instance!r} is not one of the instances of the mapping"
+            ) from None
+
+    def _expected(self) -> str:
+        values = [repr(value) for value in self._mapping]
+        if len(values) == 1:
+            return values[0]
+        return f"{', '.join(values[:-1])} or {values[-1]}"
+
+    def _core_schema(self, handler: "GetCoreSchemaHandler") -> core_schema.CoreSchema:
+        return core_schema.union_schema(
+            [
+                core_schema.literal_schema(list(self._mapping.values())),
+                core_schema.no_info_after_validator_function(
+                    self._mapping.__getitem__,
+                    core_schema.literal_schema(list(self._mapping)),
+                ),
+            ],
+            custom_error_type="literal_error",
+            custom_error_context={"expected": self._expected()},
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                self._dump,
+                return_schema=core_schema.literal_schema(list(self._mapping)),
+            ),
+        )
@@ -0,0 +1,132 @@
+import asyncio
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from ._adapter import _RESOLUTIONS_CONTEXT_KEY, PydanticAdapter
+
+
+def _key(value: Any) -> bytes | int:
+    """A key under which equal JSON values are coalesced into a single resolution."""
+    try:
+        return to_json(value)
+    except Exception:
+        return id(value)
+
+
+class _Resolutions:
+    """Collects the values which adapters with `aparse` need resolved, and then hands out the results.
+
+    On the first validation pass `resolve` records each value and returns a placeholder. Once `gather` has resolved them all, the second pass returns the results (or raises the errors) in place of the placeholders.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[PydanticAdapter, bytes | int], Any] = {}
+        self._results: dict[tuple[PydanticAdapter, bytes | int], Any] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def resolve(self, adapter: PydanticAdapter, value: Any) -> Any:
+        key = (adapter, _key(value))
+        if self._results is None:
+            self._pending.setdefault(key, value)
+            return None
+        result = self._results[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def gather(self, limit: int | None) -> None:
+        semaphore = asyncio.Semaphore(limit) if limit is not None else None
+
+        async def run(adapter: PydanticAdapter, value: Any) -> Any:
+            try:
+                if semaphore is None:
+                    return await adapter.aparse(value)
+                async with semaphore:
+                    return await adapter.aparse(value)
+            except (ValueError, AssertionError) as e:
+                return e
+
+        # A task group cancels the other calls when one fails with an error which is not a validation error
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(run(adapter, value))
+                    for (adapter, _), value in self._pending.items()
+                ]
+        except BaseExceptionGroup as e:
+            raise e.exceptions[0]
+        self._results = {key: task.result() for key, task in zip(self._pending, tasks)}
+
+
+async def _avalidate[M: BaseModel](
+    validate: Callable[..., M],
+    data: Any,
+    limit: int | None,
+    context: dict[str, Any] | None,
+) -> M:
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    resolutions = _Resolutions()
+    context = {**(context or {}), _RESOLUTIONS_CONTEXT_KEY: resolutions}
+    model = validate(data, context=context)
+    if not resolutions:
+        return model
+    await resolutions.gather(limit)
+    return validate(data, context=context)
+
+
+async def avalidate[M: BaseModel](
+    model: type[M],
+    data: Any,
+    *,
+    limit: int | None = None,
+    context: dict[str, Any] | None = None,
+) -> M:
+    """Validate data into a model, resolving the values of adapters with `aparse` concurrently.
+
+    The data is validated once to collect every value in it which needs to be resolved by an adapter's `aparse`. Equal values for the same adapter are coalesced into a single call, and all the calls are awaited concurrently. The data is then validated again using the resolved values to build the model. If no values need resolving, the model from the first pass is returned as is.
+
+    Since the data may be validated twice, model and field validators may be called twice too, and during the first pass they will see `None` in place of the values still to be resolved.
+
+    Example:
+        ```python
+        async def fetch_user(id: int) -> User:
+            ...
+
+        UserType = Annotated[User, PydanticAdapter(type=User, parse=..., dump=lambda u: u.id, aparse=fetch_user)]
+
+        class Team(BaseModel):
+            members: list[UserType]
+
+        team = await avalidate(Team, {"members": [1, 2, 3, 2]})  # fetches users 1, 2 and 3 concurrently
+        ```
+
+    Args:
+        model: The model class to validate the data into.
+        data: The data to validate.
+        limit: The maximum number of `aparse` calls to run concurrently. Unlimited by default.
+        context: Additional context to pass to the validators.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        pydantic.ValidationError: If the data is invalid, including if an `aparse` call raises a ValueError.
+        Exception: Any other error raised by an `aparse` call, such as a timeout, after the other calls still running are cancelled.
+    """
+    return await _avalidate(model.model_validate, data, limit, context)
+
+
+async def avalidate_json[M: BaseModel](
+    model: type[M],
+    data: str | bytes | bytearray,
+    *,
+    limit: int | None = None,
+    context: dict[str, Any] | None = None,
+) -> M:
+    """Like `avalidate`, but validate a JSON string into the model."""
+    return await _avalidate(model.model_validate_json, data, limit, context)
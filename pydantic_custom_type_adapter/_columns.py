@@ -0,0 +1,318 @@
+import functools
+from typing import Annotated, Any, Mapping, Sequence
+
+from pydantic import AliasChoices, BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from ._adapter import PydanticAdapter
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+"""The types which pydantic serializes as themselves in Python mode."""
+
+
+def _field_adapter(info: FieldInfo) -> PydanticAdapter | None:
+    """The adapter of a field annotated with nothing but a `PydanticAdapter`."""
+    if len(info.metadata) == 1 and isinstance(info.metadata[0], PydanticAdapter):
+        return info.metadata[0]
+    return None
+
+
+def _serialized_fields(model: type[BaseModel]) -> set[str]:
+    """The fields of a model with a `@field_serializer`, which need the model to be dumped."""
+    names: set[str] = set()
+    for decorator in model.__pydantic_decorators__.field_serializers.values():
+        fields = decorator.info.fields
+        names.update(model.model_fields if "*" in fields else fields)
+    return names
+
+
+def _validation_keys(
+    model: type[BaseModel],
+    name: str,
+    info: FieldInfo,
+    by_alias: bool | None,
+    by_name: bool | None,
+) -> list[str]:
+    """The keys by which `model_validate` would accept a field, ignoring alias paths."""
+    config = model.model_config
+    if by_alias is None:
+        by_alias = config.get("validate_by_alias", True)
+    if by_name is None:
+        by_name = config.get("validate_by_name") or config.get("populate_by_name")
+    alias = info.validation_alias if info.validation_alias is not None else info.alias
+    if alias is None:
+        return [name]
+    if isinstance(alias, AliasChoices):
+        aliases = [choice for choice in alias.choices if isinstance(choice, str)]
+    else:
+        aliases = [alias] if isinstance(alias, str) else []
+    return (aliases if by_alias else []) + ([name] if by_name else [])
+
+
+def _dump_with_model(
+    model: type[BaseModel],
+    models: Sequence[BaseModel],
+    name: str,
+    by_alias: bool | None,
+) -> list[Any]:
+    """Dump a field of each model with the model's own serializer, for fields which depend on the model."""
+    column = []
+    for instance in models:
+        dumped = model.__pydantic_serializer__.to_python(
+            instance, include={name}, by_alias=by_alias
+        )
+        if not dumped:
+            raise ValueError(
+                f"The field {name!r} of {model.__name__} is left out of some models,"
+                " so it cannot be dumped into a column"
+            )
+        column.extend(dumped.values())
+    return column
+
+
+def _transpose(rows: list[Any], model: type[BaseModel]) -> dict[str, Sequence[Any]]:
+    """Turn the dumped models into columns, for models whose `model_serializer` decides what they are dumped to."""
+    if not rows:
+        return {}
+    keys = rows[0].keys() if isinstance(rows[0], dict) else None
+    if keys is None or any(
+        not isinstance(row, dict) or row.keys() != keys for row in rows
+    ):
+        raise ValueError(
+            f"{model.__name__} is not dumped into dicts with the same keys,"
+            " so it cannot be dumped into columns"
+        )
+    return {key: [row[key] for row in rows] for key in keys}
+
+
+@functools.cache
+def _column_type_adapter(model: type[BaseModel], name: str) -> TypeAdapter[list[Any]]:
+    info = model.model_fields[name]
+    annotation = (
+        Annotated[info.annotation, *info.metadata] if info.metadata else info.annotation
+    )
+    return TypeAdapter(list[annotation], config=model.model_config)  # type: ignore[valid-type]
+
+
+@functools.cache
+def _dumped_type_adapter(adapter: PydanticAdapter) -> TypeAdapter[list[Any]]:
+    """Serializes a column of values returned by an adapter's `dump`, like the adapter's schema serializes each of them."""
+    return_type = adapter._return_type if adapter._return_type is not None else Any
+    return TypeAdapter(list[return_type])  # type: ignore[valid-type]
+
+
+@functools.cache
+def _rows_type_adapter[M: BaseModel](model: type[M]) -> TypeAdapter[list[M]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def _dump_fields(
+    model: type[BaseModel], models: Sequence[BaseModel], by_alias: bool | None
+) -> dict[str, Sequence[Any]]:
+    """Dump each field of the models into a column, keyed like `model_dump` would key it."""
+    if model.__pydantic_decorators__.model_serializers:
+        rows = [
+            model.__pydantic_serializer__.to_python(instance, by_alias=by_alias)
+            for instance in models
+        ]
+        return _transpose(rows, model)
+    use_alias = (
+        by_alias
+        if by_alias is not None
+        else model.model_config.get("serialize_by_alias", False)
+    )
+    serialized = _serialized_fields(model)
+    columns: dict[str, Sequence[Any]] = {}
+    for name, info in model.model_fields.items():
+        if info.exclude:
+            continue
+        key = (info.serialization_alias or name) if use_alias else name
+        adapter = _field_adapter(info)
+        if name in serialized or getattr(info, "exclude_if", None) is not None:
+            columns[key] = _dump_with_model(model, models, name, by_alias)
+        elif adapter is None:
+            columns[key] = _column_type_adapter(model, name).dump_python(
+                [getattr(instance, name) for instance in models], by_alias=by_alias
+            )
+        else:
+            values = [getattr(instance, name) for instance in models]
+            column = (
+                adapter._dump_many(values)
+                if adapter._dump_many is not None
+                else [adapter._dump(value) for value in values]
+            )
+            # Serialize the dumped values like model_dump does, such as models into dicts, but leave arrays, and scalars which serialize as themselves, as they are
+            if isinstance(column, (list, tuple)) and (
+                adapter._return_type is not None
+                or not all(type(value) in _SCALARS for value in column)
+            ):
+                column = _dumped_type_adapter(adapter).dump_python(
+                    column if isinstance(column, list) else list(column),
+                    by_alias=by_alias,
+                )
+            columns[key] = column
+    for name, computed in model.model_computed_fields.items():
+        key = (computed.alias or name) if use_alias else name
+        columns[key] = _dump_with_model(model, models, name, by_alias)
+    return columns
+
+
+def _split(key: str, column: Sequence[Any], columns: dict[str, Any]) -> None:
+    """Add a column, split into sub-columns if its values are dicts with the same keys."""
+    first = column[0] if len(column) else None
+    if (
+        isinstance(first, dict)
+        and first
+        and all(isinstance(k, str) and "." not in k for k in first)
+        and all(isinstance(v, dict) and v.keys() == first.keys() for v in column)
+    ):
+        for sub in first:
+            _split(f"{key}.{sub}", [value[sub] for value in column], columns)
+    else:
+        columns[key] = column
+
+
+def _regroup(columns: Mapping[str, Sequence[Any]]) -> dict[str, list[Any]]:
+    """Merge the sub-columns of each column back into a column of dicts."""
+    result: dict[str, list[Any]] = {}
+    groups: dict[str, dict[str, Sequence[Any]]] = {}
+    for key, column in columns.items():
+        name, dot, sub = key.partition(".")
+        if dot:
+            groups.setdefault(name, {})[sub] = column
+        elif hasattr(column, "tolist"):
+            result[key] = column.tolist()
+        else:
+            result[key] = column if isinstance(column, list) else list(column)
+    for name, group in groups.items():
+        sub_columns = _regroup(group)
+        result[name] = [
+            dict(zip(sub_columns, row))
+            for row in zip(*sub_columns.values(), strict=True)
+        ]
+    return result
+
+
+def _to_array(column: Sequence[Any]) -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for arrays=True, install it with"
+            " `pip install pydantic-custom-type-adapter[numpy]`"
+        ) from e
+    if isinstance(column, np.ndarray):
+        return column
+    try:
+        array = np.asarray(column)
+    except ValueError:
+        return column
+    return column if array.dtype == object else array
+
+
+def dump_columns[M: BaseModel](
+    models: Sequence[M],
+    model: type[M] | None = None,
+    *,
+    by_alias: bool | None = None,
+    arrays: bool = False,
+) -> dict[str, Any]:
+    """Dump a batch of models into columns, with one list of values per field.
+
+    Each adapter dumps a whole column at a time, with its `dump_many` function if it has one, or by calling `dump` for each value without the per-record overhead of `model_dump`, and the dumped column is then serialized by pydantic like `model_dump` serializes each value, as the adapter's `return_type` if it has one. NumPy arrays returned by `dump_many` are kept as they are. Other fields are dumped a column at a time by pydantic. Columns whose values are all dicts with the same keys, such as those of nested models or of adapters which dump to dicts, are split into sub-columns named after the field and the key, such as `position.x`. The columns hold the same keys and values as `model_dump()` in Python mode: excluded fields are left out, computed fields are included, and fields are named by their serialization aliases when dumping by alias.
+
+    Fields with a `@field_serializer` and computed fields are dumped by the model's own serializer, one model at a time, and so are whole models with a `@model_serializer`, which must dump every model into a dict with the same keys.
+
+    Example:
+        ```python
+        from pydantic_custom_type_adapter import dump_columns
+
+        columns = dump_columns(locations)
+        # {"name": ["home", "work"], "position.x": [1.0, 3.0], "position.y": [2.0, 4.0]}
+        ```
+
+    Args:
+        models: The models to dump.
+        model: The model class of the models. Defaults to the class of the first model, so it must be given if there may be no models.
+        by_alias: Whether to name the columns by the serialization aliases of the fields, like the argument of `model_dump`. Defaults to the `serialize_by_alias` setting of the model.
+        arrays: Whether to convert each column to a NumPy array where possible. Columns which NumPy can only hold as objects, such as those containing `None` or dicts, are kept as lists. Requires NumPy.
+
+    Returns:
+        The columns, keyed by field name, alias or sub-column name.
+
+    Raises:
+        ValueError: If the models cannot be dumped into columns, because a field is left out of some of them or a `@model_serializer` does not dump them into dicts with the same keys.
+    """
+    if model is None:
+        if not models:
+            raise ValueError("The model class must be given when there are no models")
+        model = type(models[0])
+    columns: dict[str, Any] = {}
+    for key, column in _dump_fields(model, models, by_alias).items():
+        _split(key, column, columns)
+    if arrays:
+        return {key: _to_array(column) for key, column in columns.items()}
+    return columns
+
+
+def validate_columns[M: BaseModel](
+    model: type[M],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    by_alias: bool | None = None,
+    by_name: bool | None = None,
+    context: dict[str, Any] | None = None,
+) -> list[M]:
+    """Validate columns of values, such as those returned by `dump_columns`, into models.
+
+    Sub-columns such as `position.x` and `position.y` are merged back into a column of dicts. The columns may be lists or NumPy arrays, and must all have the same length. Each row is validated like `model_validate` would validate a dict with the same keys, so fields are looked up by their aliases or names as the model allows, and fields without a column get their defaults. Adapters with a `parse_many` function parse their whole column at once.
+
+    Example:
+        ```python
+        from pydantic_custom_type_adapter import validate_columns
+
+        locations = validate_columns(Location, columns)
+        ```
+
+    Args:
+        model: The model class to validate the columns into.
+        columns: The columns, keyed by field name, alias or sub-column name.
+        by_alias: Whether to look up fields by their validation aliases, like the argument of `model_validate`.
+        by_name: Whether to look up fields by their names, like the argument of `model_validate`.
+        context: Additional context to pass to the validators.
+
+    Returns:
+        The validated models, one per row.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+        pydantic.ValidationError: If the values are invalid.
+    """
+    values = _regroup(columns)
+    for name, info in model.model_fields.items():
+        adapter = _field_adapter(info)
+        if adapter is None or adapter._parse_many is None:
+            continue
+        keys = _validation_keys(model, name, info, by_alias, by_name)
+        key = next((key for key in keys if key in values), None)
+        if key is None:
+            continue
+        column = columns.get(key, values[key])
+        try:
+            values[key] = list(adapter._parse_many(column))
+        except ValueError as e:
+            raise ValidationError.from_exception_data(
+                model.__name__,
+                [
+                    {
+                        "type": "value_error",
+                        "loc": (key,),
+                        "input": column,
+                        "ctx": {"error": e},
+                    }
+                ],
+            ) from e
+    rows = [dict(zip(values, row)) for row in zip(*values.values(), strict=True)]
+    return _rows_type_adapter(model).validate_python(
+        rows, context=context, by_alias=by_alias, by_name=by_name
+    )
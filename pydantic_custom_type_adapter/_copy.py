@@ -0,0 +1,62 @@
+from typing import Any, Callable
+
+from ._adapter import _resolve_ref
+
+
+def _share[T](value: T) -> T:
+    return value
+
+
+def set_copy_policy[T](
+    type: type[T],
+    *,
+    immutable: bool = False,
+    copy: Callable[[T], T] | str | None = None,
+) -> None:
+    """Set how deep copies, such as those made by `model_copy(deep=True)`, copy instances of a custom type.
+
+    Pydantic deep-copies every field when copying a model, which is wasteful for large values which are never mutated, or which can be cloned more cheaply than by copying them recursively. Since deep copies are made by `copy.deepcopy`, this sets `__deepcopy__` on the type itself, so it applies to every deep copy of its instances and of its subclasses' instances, anywhere in the process, not only to copies of models. Call it once, next to the definition of the type. Types which define or inherit `__deepcopy__` themselves cannot be given a copy policy, but a subclass of a type with a copy policy may be given a different one.
+
+    Example:
+        ```python
+        from pydantic_custom_type_adapter import set_copy_policy
+
+        set_copy_policy(Region, immutable=True)
+        set_copy_policy(TreeNode, copy=TreeNode.clone)
+
+        copied = request.model_copy(deep=True)  # copied.region is request.region
+        ```
+
+    Args:
+        type: The custom type.
+        immutable: Whether instances of the type are immutable, so deep copies can share them instead of copying them.
+        copy: A function which returns a deep copy of an instance of the type, used instead of copying it recursively. May also be the import path of such a function.
+
+    Raises:
+        ValueError: If both or neither of `immutable` and `copy` are given, or if the type already has a different copy policy, defines or inherits its own `__deepcopy__`, or does not allow setting attributes, like built-in types.
+    """
+    if immutable == (copy is not None):
+        raise ValueError("Exactly one of immutable and copy must be given")
+    policy: Callable[[T], T] = _share if copy is None else _resolve_ref(copy)
+    existing = getattr(type, "__deepcopy__", None)
+    own = "__deepcopy__" in type.__dict__
+    if existing is not None:
+        existing_policy = getattr(existing, "_copy_policy", None)
+        if own and existing_policy == policy:
+            return
+        if own and existing_policy is not None:
+            raise ValueError(f"{type.__name__} already has a different copy policy")
+        if existing_policy is None:
+            defined = "defines" if own else "inherits"
+            raise ValueError(
+                f"{type.__name__} {defined} its own __deepcopy__, so a copy policy cannot be set"
+            )
+
+    def __deepcopy__(self: T, memo: dict[int, Any]) -> T:
+        return policy(self)
+
+    __deepcopy__._copy_policy = policy  # type: ignore[attr-defined]
+    try:
+        type.__deepcopy__ = __deepcopy__  # type: ignore[attr-defined]
+    except TypeError as e:
+        raise ValueError(f"Cannot set a copy policy on {type.__name__}") from e
@@ -0,0 +1,51 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+from pydantic import BaseModel
+
+
+def _validate_chunk[M: BaseModel](model: type[M], chunk: list[str | bytes]) -> list[M]:
+    return [model.model_validate_json(payload) for payload in chunk]
+
+
+def validate_many_parallel[M: BaseModel](
+    model: type[M],
+    payloads: Iterable[str | bytes],
+    *,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> list[M]:
+    """Validate many JSON payloads into models using a pool of processes.
+
+    The payloads are split into chunks of `chunk_size` which are validated in parallel by `workers` processes, making use of multiple cores for CPU-bound validation. The validated models are returned in the same order as the payloads.
+
+    The model class is sent to the worker processes by reference, so it must be importable (i.e. defined at the top level of a module), and the validated models are sent back by pickling them, so the custom types they contain must be picklable.
+
+    Example:
+        ```python
+        from pydantic_custom_type_adapter import validate_many_parallel
+
+        with open("users.jsonl", "rb") as f:
+            users = validate_many_parallel(User, f, workers=4)
+        ```
+
+    Args:
+        model: The model class to validate the payloads into.
+        payloads: The JSON payloads to validate.
+        workers: The number of worker processes. Defaults to the number of CPUs.
+        chunk_size: The number of payloads sent to a worker at a time. Larger chunks reduce the inter-process overhead, while smaller ones balance the load better.
+
+    Returns:
+        The validated models, in the same order as `payloads`.
+
+    Raises:
+        pydantic.ValidationError: If any of the payloads is invalid. The error of the first invalid chunk is raised.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    iterator = iter(payloads)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_validate_chunk, itertools.repeat(model), chunks)
+        return list(itertools.chain.from_iterable(results))
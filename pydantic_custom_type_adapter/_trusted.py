@@ -0,0 +1,141 @@
+import copy
+import functools
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator, core_schema
+
+from ._adapter import _ADAPTER_METADATA_KEY, PydanticAdapter, _shadow
+
+
+def _validate_model[T](
+    cls: type[T],
+    shadow: type[T],
+    revalidate: str,
+    value: Any,
+    handler: core_schema.ValidatorFunctionWrapHandler,
+) -> T:
+    """Validate a model or dataclass with the trusted copy of its schema, which validates into `shadow`, and give the result the original class back.
+
+    Instances of the original class are passed through or revalidated according to `revalidate`, like the model's own validator does.
+    """
+    if isinstance(value, cls):
+        if revalidate == "never" or (
+            revalidate == "subclass-instances" and type(value) is cls
+        ):
+            return value
+        value = copy.copy(value)
+        object.__setattr__(value, "__class__", shadow)
+    instance = handler(value)
+    object.__setattr__(instance, "__class__", cls)
+    return instance
+
+
+def _trust(node: Any, changed: frozenset[str] = frozenset()) -> Any:
+    """Copy a core schema, making every adapter with a `construct` function use it instead of `parse`.
+
+    Parts of the schema without such adapters are returned as is, so pydantic-core can reuse the existing validators of the models in them. `changed` holds the refs of the definitions which were changed.
+    """
+    if isinstance(node, (list, tuple)):
+        items = [_trust(item, changed) for item in node]
+        if all(new is old for new, old in zip(items, node)):
+            return node
+        return type(node)(items)
+    if not isinstance(node, dict):
+        return node
+    adapter = node.get("metadata", {}).get(_ADAPTER_METADATA_KEY)
+    if isinstance(adapter, PydanticAdapter):
+        return node if adapter._construct is None else adapter._trusted_schema(node)
+    if node.get("type") == "definition-ref":
+        return dict(node) if node["schema_ref"] in changed else node
+    if node.get("type") == "definitions":
+        # Definitions may refer to each other, so repeat until no more of them change
+        while True:
+            definitions = [_trust(d, changed) for d in node["definitions"]]
+            refs = {
+                d["ref"]
+                for d, new in zip(node["definitions"], definitions)
+                if new is not d
+            }
+            if refs <= changed:
+                break
+            changed = changed | refs
+        result = {
+            **node,
+            "definitions": definitions,
+            "schema": _trust(node["schema"], changed),
+        }
+    else:
+        result = {key: _trust(value, changed) for key, value in node.items()}
+    if all(result[key] is value for key, value in node.items()):
+        return node
+    if node.get("type") in ("model", "dataclass"):
+        # Validate into a subclass, so the modified schema is built, and give the instances the original class back
+        cls = node["cls"]
+        shadow = _shadow(cls)
+        revalidate = node.get("revalidate_instances") or node.get("config", {}).get(
+            "revalidate_instances", "never"
+        )
+        result["cls"] = shadow
+        # Only instances which must be revalidated are given to the shadow class
+        result["revalidate_instances"] = "always"
+        wrapper: dict[str, Any] = dict(
+            core_schema.no_info_wrap_validator_function(
+                functools.partial(_validate_model, cls, shadow, revalidate), result  # type: ignore[arg-type]
+            )
+        )
+        if "ref" in result:
+            wrapper["ref"] = result.pop("ref")
+        return wrapper
+    return result
+
+
+@functools.cache
+def _trusted_validator(model: type[BaseModel]) -> SchemaValidator:
+    model.model_rebuild()
+    # Keep the title of the model's own validator, rather than that of the wrapper around the model
+    return SchemaValidator(
+        _trust(model.__pydantic_core_schema__),
+        {"title": model.__pydantic_validator__.title},
+    )
+
+
+def validate_trusted[M: BaseModel](
+    model: type[M], data: Any, *, context: dict[str, Any] | None = None
+) -> M:
+    """Validate trusted data into a model, building the values of adapters with their `construct` functions instead of `parse`.
+
+    This is meant for data your own code produced, such as a cache or an internal queue, which is known to be valid, so the checks in `parse` are wasted work. The model is validated by a separate validator, built the first time the model is validated this way, so validating untrusted data with the model's own methods is not slowed down. Adapters without `construct` use `parse` as usual, and the rest of the model is validated as usual.
+
+    Example:
+        ```python
+        EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email, dump=str, construct=unchecked_email)]
+
+        class User(BaseModel):
+            email: EmailType
+
+        user = validate_trusted(User, {"email": "john@example.com"})  # calls unchecked_email, not Email
+        ```
+
+    Args:
+        model: The model class to validate the data into.
+        data: The data to validate.
+        context: Additional context to pass to the validators.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        pydantic.ValidationError: If the data is invalid in a way which is still checked.
+    """
+    return _trusted_validator(model).validate_python(data, context=context)
+
+
+def validate_trusted_json[M: BaseModel](
+    model: type[M],
+    data: str | bytes | bytearray,
+    *,
+    context: dict[str, Any] | None = None,
+) -> M:
+    """Like `validate_trusted`, but validate a JSON string into the model."""
+    return _trusted_validator(model).validate_json(data, context=context)
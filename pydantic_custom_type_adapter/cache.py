@@ -0,0 +1,149 @@
+"""Cache the core schemas of models on disk, to start new processes faster.
+
+Most of the time it takes to build a model goes into generating its core schema in Python, which every new process repeats for every model it uses. A `SchemaCache` saves the core schema of each model to a directory the first time it is built, and later processes load it from there and only build the validator and serializer from it. The validator and serializer themselves cannot be saved, but building them from a schema is comparatively cheap.
+
+Schemas are saved with pickle, so adapters are saved by reference to their `parse` and `dump` functions, and models and custom types by reference to their classes. Models whose schemas contain objects which cannot be pickled, such as adapters with lambdas, are built as usual and not cached. To save the time spent generating the schema when a model is defined, the model should be created with `defer_build=True`:
+
+```python
+from pydantic import BaseModel, ConfigDict
+from pydantic_custom_type_adapter.cache import SchemaCache
+
+class Event(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    ...
+
+validator, serializer = SchemaCache("/var/cache/my_app", version=APP_VERSION).load(Event)
+event = validator.validate_json(payload)
+data = serializer.to_json(event)
+```
+
+A schema may depend on code which it does not refer to, such as a constant imported from another module and used as a constraint, so the cache cannot tell on its own when all of its schemas are stale. The cache is therefore keyed on a `version` given by the application, which must change whenever the code defining its models may have changed, such as the application's release version or the commit it was built from. Cached schemas are also invalidated when the version of Python, pydantic or pydantic-core changes, and when the source of a module whose objects the schema contains changes, including the modules of this package which define the adapters in it. Loading a schema unpickles it, so the cache directory must only be writable by trusted users.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+# Packages whose modules are covered by the versions in the cache key, so their sources are not hashed
+_VERSIONED_PACKAGES = {"pydantic", "pydantic_core", *sys.stdlib_module_names}
+
+
+def _hash_file(path: str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class _Pickler(pickle.Pickler):
+    """A pickler which records the source files of the modules of the objects it pickles."""
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.files: set[str] = set()
+
+    def reducer_override(self, obj: Any) -> Any:
+        module_name = getattr(obj, "__module__", None)
+        if (
+            isinstance(module_name, str)
+            and module_name.partition(".")[0] not in _VERSIONED_PACKAGES
+        ):
+            file = getattr(sys.modules.get(module_name), "__file__", None)
+            if file is not None:
+                self.files.add(file)
+        return NotImplemented
+
+
+class SchemaCache:
+    """A directory of cached model core schemas.
+
+    Each model's schema is stored in its own file, named after the model and a hash of the versions it depends on, and is replaced atomically, so the same directory may be shared by many processes.
+
+    Args:
+        directory: The directory to store the schemas in. It is created if it does not exist.
+        version: The version of the code defining the models, such as the application's release version or commit. It must change whenever that code may have changed, since schemas saved under another version are never loaded.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], version: str) -> None:
+        self._directory = Path(directory)
+        versions = (
+            sys.version,
+            pydantic.VERSION,
+            pydantic_core.__version__,
+            version,
+        )
+        self._key = hashlib.sha256(repr(versions).encode()).hexdigest()[:16]
+
+    def _path(self, model: type[BaseModel]) -> Path:
+        return self._directory / f"{model.__module__}.{model.__qualname__}.{self._key}"
+
+    def _read(self, path: Path) -> Any:
+        """Load a cached schema, or return `None` if there is none or it is stale."""
+        try:
+            with open(path, "rb") as f:
+                files, data = pickle.load(f)
+            if any(_hash_file(file) != digest for file, digest in files.items()):
+                return None
+            return pickle.loads(data)
+        except (
+            OSError,
+            EOFError,
+            ValueError,
+            ImportError,
+            AttributeError,
+            TypeError,
+            KeyError,
+            pickle.UnpicklingError,
+        ):
+            return None
+
+    def _write(self, path: Path, schema: Any) -> None:
+        buffer = io.BytesIO()
+        pickler = _Pickler(buffer)
+        try:
+            pickler.dump(schema)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        files = {file: _hash_file(file) for file in pickler.files}
+        temporary: Path | None = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # A unique file, so that threads and processes saving the same schema do not write into each other's
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory, prefix=f"{path.name}.", suffix=".tmp", delete=False
+            ) as f:
+                temporary = Path(f.name)
+                pickle.dump((files, buffer.getvalue()), f)
+            os.replace(temporary, path)
+        except OSError:
+            if temporary is not None:
+                temporary.unlink(missing_ok=True)
+
+    def load(self, model: type[BaseModel]) -> tuple[SchemaValidator, SchemaSerializer]:
+        """Build a validator and a serializer for a model from its cached schema.
+
+        If the schema is not cached yet, or is stale, the model's schema is generated (completing the model if it was created with `defer_build=True`) and saved to the cache.
+
+        The model itself is not modified when its schema is loaded from the cache, so use the returned validator and serializer rather than the model's own methods, which would still generate the schema.
+
+        Args:
+            model: The model class. It must be defined at the top level of an importable module to be cached.
+
+        Returns:
+            A validator which validates data into instances of the model, and a serializer which serializes them.
+        """
+        path = self._path(model)
+        schema = self._read(path)
+        if schema is None:
+            model.model_rebuild()
+            schema = model.__pydantic_core_schema__
+            if "<locals>" not in model.__qualname__:
+                self._write(path, schema)
+        return SchemaValidator(schema), SchemaSerializer(schema)
@@ -0,0 +1,325 @@
+"""Find the adapters in a model and measure the Python callbacks they cost.
+
+Pydantic validates and serializes most types without running any Python code, but each adapter calls back into Python to `parse` and `dump` its values. `inspect_model` finds every adapter in a model's core schema, validates and dumps sample payloads with instrumented copies of the model's validator and serializer, and reports for each adapter:
+
+- Where it is in the model, such as `Order.items[].price`.
+- How many times it was validated, and how many of those called its Python validator rather than accepting an existing instance.
+- How many times its Python serializer was called.
+- The estimated time spent in its callbacks per record.
+- Hints for faster modes the adapter could use.
+
+It can also be run from the command line, given the import path of the model and files with sample payloads (either a JSON document, a JSON array of payloads or JSON lines):
+
+```sh
+$ python -m pydantic_custom_type_adapter.inspect my_module:Order samples.jsonl
+```
+"""
+
+import argparse
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from ._adapter import _ADAPTER_METADATA_KEY, PydanticAdapter, _import_path, _shadow
+
+
+@dataclass
+class AdapterReport:
+    """The callbacks made by one adapter while validating and dumping the samples."""
+
+    location: str
+    """The location of the adapter in the model, such as `Order.items[].price`."""
+    adapter: PydanticAdapter
+    """The adapter."""
+    records: int = 0
+    """The number of sample records validated and dumped."""
+    validations: int = 0
+    """The number of values validated by the adapter, including existing instances."""
+    validator_calls: int = 0
+    """The number of calls to the adapter's Python validator, such as `parse`."""
+    serializer_calls: int = 0
+    """The number of calls to the adapter's Python serializer, such as `dump`."""
+    seconds: float = 0.0
+    """The total time spent in the adapter's Python callbacks."""
+    hints: list[str] = field(default_factory=list)
+    """Suggestions for making the adapter faster."""
+
+    @property
+    def seconds_per_record(self) -> float:
+        """The estimated time spent in the adapter's Python callbacks per record."""
+        return self.seconds / self.records if self.records else 0.0
+
+
+def _timed(function: Callable[..., Any], report: AdapterReport, counter: str) -> Any:
+    def wrapper(*args: Any) -> Any:
+        setattr(report, counter, getattr(report, counter) + 1)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            report.seconds += time.perf_counter() - start
+
+    return wrapper
+
+
+def _instrument_functions(node: Any, report: AdapterReport) -> Any:
+    """Copy the schema of an adapter, wrapping its Python validator functions to measure them."""
+    if isinstance(node, list):
+        return [_instrument_functions(item, report) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {key: _instrument_functions(value, report) for key, value in node.items()}
+    function = node.get("function")
+    if isinstance(function, dict) and callable(function.get("function")):
+        result["function"] = {
+            **function,
+            "function": _timed(function["function"], report, "validator_calls"),
+        }
+    return result
+
+
+def _instrument_adapter(node: dict[str, Any], report: AdapterReport) -> dict[str, Any]:
+    serialization = node.get("serialization")
+    result = _instrument_functions(
+        {key: value for key, value in node.items() if key != "serialization"}, report
+    )
+    if serialization is not None:
+        result["serialization"] = {
+            **serialization,
+            "function": _timed(serialization["function"], report, "serializer_calls"),
+        }
+
+    def count(value: Any, handler: Callable[[Any], Any]) -> Any:
+        report.validations += 1
+        return handler(value)
+
+    wrapper = {
+        "type": "function-wrap",
+        "function": {"type": "no-info", "function": count},
+        "schema": result,
+    }
+    if "serialization" in result:
+        wrapper["serialization"] = result["serialization"]
+    return wrapper
+
+
+def _hint(node: dict[str, Any], report: AdapterReport) -> None:
+    choices = node.get("choices", [])
+    if node["type"] == "union" and [choice["type"] for choice in choices] == [
+        "is-instance",
+        "function-plain",
+    ]:
+        report.hints.append(
+            "No input_type: input of the wrong type is only rejected by calling"
+            " `parse`, and pydantic cannot pre-validate the input."
+        )
+    serialization = node.get("serialization", {})
+    if (
+        serialization.get("type") == "function-plain"
+        and not serialization.get("info_arg")
+        and "return_schema" not in serialization
+    ):
+        report.hints.append(
+            "No return_type: pydantic has to inspect the output of `dump` to find"
+            " out how to serialize it."
+        )
+
+
+def _overlaps(a: PydanticAdapter, b: PydanticAdapter) -> bool:
+    return issubclass(a._type, b._type) or issubclass(b._type, a._type)
+
+
+def _choice_adapter(choice: Any, definitions: dict[str, Any]) -> PydanticAdapter | None:
+    """The adapter which is a choice of a union, possibly wrapped in a nullable or definition-ref schema."""
+    node = choice[0] if isinstance(choice, tuple) else choice
+    seen: set[str] = set()
+    while isinstance(node, dict):
+        if node.get("type") == "nullable":
+            node = node["schema"]
+        elif node.get("type") == "definition-ref" and node["schema_ref"] not in seen:
+            seen.add(node["schema_ref"])
+            node = definitions.get(node["schema_ref"])
+        else:
+            adapter = node.get("metadata", {}).get(_ADAPTER_METADATA_KEY)
+            return adapter if isinstance(adapter, PydanticAdapter) else None
+    return None
+
+
+def _instrument(
+    node: Any,
+    location: str,
+    reports: list[AdapterReport],
+    definitions: dict[str, Any] | None = None,
+) -> Any:
+    """Copy a core schema, instrumenting the schema of every adapter in it."""
+    definitions = definitions or {}
+    if isinstance(node, list):
+        return [_instrument(item, location, reports, definitions) for item in node]
+    if isinstance(node, tuple):
+        return tuple(_instrument(item, location, reports, definitions) for item in node)
+    if not isinstance(node, dict):
+        return node
+    adapter = node.get("metadata", {}).get(_ADAPTER_METADATA_KEY)
+    if isinstance(adapter, PydanticAdapter):
+        report = AdapterReport(location, adapter)
+        _hint(node, report)
+        reports.append(report)
+        return _instrument_adapter(node, report)
+    if node.get("type") == "definitions":
+        definitions = {
+            **definitions,
+            **{definition["ref"]: definition for definition in node["definitions"]},
+        }
+
+    result: dict[str, Any] = {}
+    for key, value in node.items():
+        if key == "cls" and node.get("type") in ("model", "dataclass"):
+            result[key] = _shadow(value)
+        elif key == "fields" and isinstance(value, dict):
+            result[key] = {
+                name: _instrument(field, f"{location}.{name}", reports, definitions)
+                for name, field in value.items()
+            }
+        elif key == "fields" and isinstance(value, list):
+            result[key] = [
+                _instrument(
+                    field, f"{location}.{field.get('name')}", reports, definitions
+                )
+                for field in value
+            ]
+        elif key == "definitions":
+            result[key] = [
+                _instrument(
+                    definition,
+                    getattr(definition.get("cls"), "__name__", ""),
+                    reports,
+                    definitions,
+                )
+                for definition in value
+            ]
+        elif key == "choices":
+            result[key] = []
+            choices: list[tuple[PydanticAdapter, AdapterReport | None]] = []
+            for choice in value:
+                start = len(reports)
+                result[key].append(_instrument(choice, location, reports, definitions))
+                choice_adapter = _choice_adapter(choice, definitions)
+                if choice_adapter is not None:
+                    choice_report = next(
+                        (r for r in reports[start:] if r.adapter is choice_adapter),
+                        None,
+                    )
+                    choices.append((choice_adapter, choice_report))
+            _hint_union(choices)
+        else:
+            label = {
+                "items_schema": "[]",
+                "values_schema": "{}",
+                "keys_schema": "{key}",
+            }
+            result[key] = _instrument(
+                value, location + label.get(key, ""), reports, definitions
+            )
+    return result
+
+
+def _hint_union(choices: list[tuple[PydanticAdapter, AdapterReport | None]]) -> None:
+    """Add a hint to the adapters which are choices of the same union as an adapter for an overlapping type."""
+    for i, (adapter, report) in enumerate(choices):
+        if report is not None and any(
+            j != i and _overlaps(adapter, other) for j, (other, _) in enumerate(choices)
+        ):
+            report.hints.append(
+                "In a union with another adapter for an overlapping type: instances"
+                " always match the first of them, and invalid input is parsed by each"
+                " in turn. Consider a single adapter which parses all the formats."
+            )
+
+
+def inspect_model(
+    model: type[BaseModel], samples: Iterable[Any] = ()
+) -> list[AdapterReport]:
+    """Report the adapters in a model and the Python callbacks they make.
+
+    Each sample is validated (as JSON if it is a string or bytes, or as Python data otherwise) and the result is dumped to JSON, using instrumented copies of the model's validator and serializer. The model itself is not modified.
+
+    Example:
+        ```python
+        from pydantic_custom_type_adapter.inspect import format_reports, inspect_model
+
+        print(format_reports(inspect_model(Order, samples)))
+        ```
+
+    Args:
+        model: The model class to inspect.
+        samples: Sample payloads to validate and dump. If there are none, only the locations of the adapters and the hints are reported.
+
+    Returns:
+        A report for each adapter in the model, in the order they appear in the schema.
+    """
+    reports: list[AdapterReport] = []
+    schema = _instrument(model.__pydantic_core_schema__, model.__name__, reports)
+    validator = SchemaValidator(schema)  # type: ignore[arg-type]
+    serializer = SchemaSerializer(schema)  # type: ignore[arg-type]
+    records = 0
+    for sample in samples:
+        if isinstance(sample, (str, bytes, bytearray)):
+            instance = validator.validate_json(sample)
+        else:
+            instance = validator.validate_python(sample)
+        serializer.to_json(instance)
+        records += 1
+    for report in reports:
+        report.records = records
+    return reports
+
+
+def format_reports(reports: Sequence[AdapterReport]) -> str:
+    """Format adapter reports as text, with the most expensive adapters first."""
+    lines = []
+    for report in sorted(reports, key=lambda r: r.seconds, reverse=True):
+        lines.append(f"{report.location}: adapter for {report.adapter._type.__name__}")
+        if report.records:
+            lines.append(
+                f"    {report.validations / report.records:.1f} validations,"
+                f" {report.validator_calls / report.records:.1f} validator calls,"
+                f" {report.serializer_calls / report.records:.1f} serializer calls,"
+                f" {report.seconds_per_record * 1e6:.2f} us per record"
+            )
+        lines.extend(f"    hint: {hint}" for hint in report.hints)
+    return "\n".join(lines)
+
+
+def _load_samples(path: str) -> list[Any]:
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return [line for line in content.splitlines() if line.strip()]
+    return [json.dumps(item) for item in (data if isinstance(data, list) else [data])]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pydantic_custom_type_adapter.inspect",
+        description="Report the adapters in a model and the Python callbacks they make.",
+    )
+    parser.add_argument("model", help="import path of the model, e.g. my_module:Model")
+    parser.add_argument("samples", nargs="*", help="files with sample payloads")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="validate and dump the samples N times"
+    )
+    args = parser.parse_args(argv)
+
+    model = _import_path(args.model)
+    samples = [sample for path in args.samples for sample in _load_samples(path)]
+    print(format_reports(inspect_model(model, samples * args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
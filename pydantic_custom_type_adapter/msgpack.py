@@ -0,0 +1,78 @@
+"""Serialize models to and from MessagePack.
+
+This module requires msgpack, which can be installed with the `msgpack` extra:
+
+```sh
+$ pip install pydantic-custom-type-adapter[msgpack]
+```
+
+Models are dumped with their adapters' `dump` functions and validated with their `parse` functions, except that adapters which were given `dump_binary` and `parse_binary` use those instead, so that their values can be stored in a native binary form (such as raw `bytes`) rather than formatted as strings.
+
+Unlike JSON, the decoded data is validated in Python mode. Values which MessagePack cannot represent natively, such as UUIDs, decimals, naive datetimes, enums, sets and tuples, are stored in their JSON-compatible form, and strict validation does not accept that form in Python mode, so models or fields with `strict=True` holding such values do not round-trip. Validate them with `strict=False`, or give their types adapters.
+
+Example:
+    ```python
+    from pydantic_custom_type_adapter.msgpack import dump_msgpack, validate_msgpack
+
+    data = dump_msgpack(event)
+    event = validate_msgpack(Event, data)
+    ```
+"""
+
+from typing import Any
+
+try:
+    import msgpack
+except ImportError as e:
+    raise ImportError(
+        "msgpack is required for pydantic_custom_type_adapter.msgpack, install it"
+        " with `pip install pydantic-custom-type-adapter[msgpack]`"
+    ) from e
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from ._adapter import _BINARY_CONTEXT_KEY
+
+
+def dump_msgpack(model: BaseModel, *, context: dict[str, Any] | None = None) -> bytes:
+    """Serialize a model to MessagePack.
+
+    Timezone-aware datetimes are stored with MessagePack's native timestamp type, and are validated back as UTC datetimes. Other values which MessagePack cannot represent natively, such as naive datetimes and UUIDs, are converted to their JSON-compatible form.
+
+    Args:
+        model: The model to serialize.
+        context: Additional context to pass to the serializers.
+
+    Returns:
+        The MessagePack-encoded model.
+    """
+    data = model.model_dump(context={**(context or {}), _BINARY_CONTEXT_KEY: True})
+    return msgpack.packb(data, datetime=True, default=to_jsonable_python)
+
+
+def validate_msgpack[M: BaseModel](
+    model: type[M],
+    data: bytes,
+    *,
+    strict: bool | None = None,
+    context: dict[str, Any] | None = None,
+) -> M:
+    """Validate MessagePack-encoded data into a model.
+
+    Args:
+        model: The model class to validate the data into.
+        data: The MessagePack-encoded data, such as that returned by `dump_msgpack`.
+        strict: Whether to validate strictly, overriding the model's `strict` setting like the argument of `model_validate`. Pass `False` for strict models with values stored in their JSON-compatible form.
+        context: Additional context to pass to the validators.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        pydantic.ValidationError: If the data is invalid.
+    """
+    return model.model_validate(
+        msgpack.unpackb(data, strict_map_key=False, timestamp=3),
+        strict=strict,
+        context={**(context or {}), _BINARY_CONTEXT_KEY: True},
+    )
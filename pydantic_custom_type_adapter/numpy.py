@@ -0,0 +1,146 @@
+"""Adapters for NumPy arrays.
+
+This module requires NumPy, which can be installed with the `numpy` extra:
+
+```sh
+$ pip install pydantic-custom-type-adapter[numpy]
+```
+"""
+
+import base64
+from typing import Any, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError(
+        "NumPy is required for pydantic_custom_type_adapter.numpy, install it with"
+        " `pip install pydantic-custom-type-adapter[numpy]`"
+    ) from e
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from ._adapter import PydanticAdapter
+
+
+class NDArrayAdapter(PydanticAdapter[np.ndarray, Any]):
+    """A Pydantic adapter for NumPy arrays.
+
+    Arrays are converted to and from JSON in one of the following formats:
+
+    - `"list"`: A nested list, e.g. `[[1, 2], [3, 4]]`.
+    - `"base64"`: An object with the array's raw bytes encoded as base64, its dtype and its shape, e.g. `{"data": "AQAAAAIAAAA...", "dtype": "<i8", "shape": [2, 2]}`. This is the most compact and fastest format.
+    - `"flat"`: An object with a flat list of the values and the shape, e.g. `{"data": [1, 2, 3, 4], "shape": [2, 2]}`.
+
+    All conversions are vectorized. Arrays which are already instances of `numpy.ndarray` with the right dtype are used as is, and in the base64 format the array is created over the decoded buffer without copying it, so those arrays are read-only. When validating Python objects in the base64 format, `data` may also be a bytes-like object, in which case the array shares its memory.
+
+    Example:
+        ```python
+        from typing import Annotated
+        import numpy as np
+        from pydantic import BaseModel
+        from pydantic_custom_type_adapter.numpy import NDArrayAdapter
+
+        class Image(BaseModel):
+            pixels: Annotated[np.ndarray, NDArrayAdapter(dtype=np.uint8, shape=(None, None, 3), format="base64")]
+        ```
+
+    Args:
+        dtype: The dtype the arrays must have. Values of the same kind are cast to it (e.g. integers to a float dtype, or to a narrower or unsigned integer dtype), but values of another kind, or which are out of the range of the dtype, are rejected. Any dtype except `object` is accepted if not given.
+        shape: The shape the arrays must have, where `None` accepts any size for that dimension. Any shape is accepted if not given.
+        format: The JSON format of the arrays, one of `"list"`, `"base64"` or `"flat"`.
+    """
+
+    def __init__(
+        self,
+        *,
+        dtype: npt.DTypeLike | None = None,
+        shape: tuple[int | None, ...] | None = None,
+        format: Literal["list", "base64", "flat"] = "list",
+    ) -> None:
+        if format not in ("list", "base64", "flat"):
+            raise ValueError(f"Unknown array format {format!r}")
+        super().__init__(np.ndarray, parse=self._parse_array, dump=self._dump_array)
+        self._dtype = None if dtype is None else np.dtype(dtype)
+        self._shape = shape
+        self._format = format
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"dtype": self._dtype, "shape": self._shape, "format": self._format}
+
+    @staticmethod
+    def _cast(array: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Cast an array to a dtype of the same kind, rejecting values which it cannot hold."""
+        # Signed and unsigned integers are the same kind here, since JSON integers are parsed as int64
+        integers = array.dtype.kind in "biu" and dtype.kind in "iu"
+        if not integers and not np.can_cast(array.dtype, dtype, casting="same_kind"):
+            raise ValueError(f"Expected an array of {dtype}, not {array.dtype}")
+        if dtype.kind in "iu" and array.size:
+            info = np.iinfo(dtype)
+            if array.min() < info.min or array.max() > info.max:
+                raise ValueError(
+                    f"Values out of range for {dtype}, which holds {info.min} to"
+                    f" {info.max}"
+                )
+        with np.errstate(over="ignore"):
+            result = array.astype(dtype)
+        if dtype.kind in "fc" and not np.all(np.isfinite(result) | ~np.isfinite(array)):
+            raise ValueError(f"Values out of range for {dtype}")
+        return result
+
+    def _check(self, array: np.ndarray) -> np.ndarray:
+        if self._dtype is None:
+            if array.dtype.kind == "O":
+                raise ValueError("Array values must be numeric, boolean or strings")
+        elif array.dtype != self._dtype:
+            array = self._cast(array, self._dtype)
+        if self._shape is not None and (
+            len(array.shape) != len(self._shape)
+            or any(e is not None and e != a for e, a in zip(self._shape, array.shape))
+        ):
+            expected = tuple("*" if e is None else e for e in self._shape)
+            raise ValueError(
+                f"Expected an array of shape {expected}, not {array.shape}"
+            )
+        return array
+
+    def _parse_array(self, value: Any) -> np.ndarray:
+        if isinstance(value, np.ndarray):
+            return self._check(value)
+        try:
+            match self._format:
+                case "list":
+                    array = np.asarray(value)
+                case "base64":
+                    data = value["data"]
+                    buffer = base64.b64decode(data) if isinstance(data, str) else data
+                    array = np.frombuffer(buffer, dtype=np.dtype(value["dtype"]))
+                    array = array.reshape(value["shape"])
+                case "flat":
+                    array = np.asarray(value["data"]).reshape(value["shape"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid array in {self._format} format: {e}") from e
+        return self._check(array)
+
+    def _dump_array(self, array: np.ndarray) -> Any:
+        match self._format:
+            case "list":
+                return array.tolist()
+            case "base64":
+                return {
+                    "data": base64.b64encode(np.ascontiguousarray(array).data).decode(),
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape),
+                }
+            case "flat":
+                return {"data": array.ravel().tolist(), "shape": list(array.shape)}
+
+    def _core_schema(self, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Arrays which are already instances are checked too, so no union with an is-instance schema
+        return core_schema.no_info_plain_validator_function(
+            self._parse_array,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                self._dump_array
+            ),
+        )
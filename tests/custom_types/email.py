@@ -20,3 +20,9 @@ class Email:
     @classmethod
     def parse(cls, value: str) -> Self:
         return cls(value)
+
+    @classmethod
+    def unchecked(cls, address: str) -> Self:
+        instance = cls.__new__(cls)
+        instance.address = address
+        return instance
@@ -17,3 +17,9 @@ class SafeString:
     @classmethod
     def parse(cls, value: str) -> Self:
         return cls(value)
+
+    @classmethod
+    def unchecked(cls, value: str) -> Self:
+        instance = cls.__new__(cls)
+        instance.value = value
+        return instance
@@ -0,0 +1,135 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_custom_type_adapter import PydanticAdapter, avalidate, avalidate_json
+from tests.custom_types import Email, UserId
+
+
+class UserService:
+    """A stub service which resolves user IDs, recording its calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+        self.unreachable: set[int] = set()
+
+    async def lookup(self, value: int) -> UserId:
+        self.calls.append(value)
+        if value in self.unreachable:
+            raise ConnectionError(f"User {value} is unreachable")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        return UserId(value)
+
+
+# The service which the adapter of `Team` looks users up in, set by the `service` fixture
+current_service: ContextVar[UserService] = ContextVar("current_service")
+
+
+async def lookup(value: int) -> UserId:
+    return await current_service.get().lookup(value)
+
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+UserIdType = Annotated[
+    UserId,
+    PydanticAdapter(
+        type=UserId, parse=UserId.parse, dump=lambda uid: uid.id, aparse=lookup
+    ),
+]
+
+
+class Team(BaseModel):
+    owner: UserIdType
+    email: EmailType
+    members: list[UserIdType]
+
+
+@pytest.fixture
+def service() -> UserService:
+    service = UserService()
+    current_service.set(service)
+    return service
+
+
+def test_avalidate_coalesces_resolutions(service: UserService) -> None:
+    """Test that duplicate values are resolved once and concurrently."""
+
+    data = {"owner": 1, "email": "team@example.com", "members": [1, 2, 3, 2, 3]}
+    team = asyncio.run(avalidate(Team, data))
+
+    assert team.owner == UserId(1)
+    assert team.email == Email("team@example.com")
+    assert team.members == [UserId(i) for i in (1, 2, 3, 2, 3)]
+    assert sorted(service.calls) == [1, 2, 3]
+    assert service.max_active == 3
+
+    # Sync validation still uses parse
+    assert Team.model_validate(data).members[1] == UserId(2)
+    assert len(service.calls) == 3
+
+
+def test_avalidate_limit(service: UserService) -> None:
+    """Test that the number of concurrent resolutions is limited."""
+
+    json_data = '{"owner": 1, "email": "team@example.com", "members": [2, 3, 4, 5]}'
+    team = asyncio.run(avalidate_json(Team, json_data, limit=2))
+
+    assert team.members == [UserId(i) for i in (2, 3, 4, 5)]
+    assert sorted(service.calls) == [1, 2, 3, 4, 5]
+    assert service.max_active == 2
+
+
+def test_avalidate_errors(service: UserService) -> None:
+    """Test that errors from aparse and other fields become validation errors."""
+
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(
+            avalidate(Team, {"owner": 1, "email": "team@example.com", "members": [-1]})
+        )
+    assert "User ID must be positive" in str(exc_info.value)
+    assert exc_info.value.errors()[0]["loc"][:2] == ("members", 0)
+
+    # Invalid fields fail before any resolution is attempted
+    service.calls.clear()
+    with pytest.raises(ValidationError):
+        asyncio.run(avalidate(Team, {"owner": 1, "email": "invalid", "members": []}))
+    assert service.calls == []
+
+
+def test_avalidate_cancels_on_failure(service: UserService) -> None:
+    """Test that other resolutions are cancelled when one fails with an error other than a validation error."""
+
+    service.unreachable.add(3)
+    data = {"owner": 1, "email": "team@example.com", "members": [2, 3, 4]}
+
+    async def validate() -> None:
+        with pytest.raises(ConnectionError):
+            await avalidate(Team, data)
+        # The other lookups are already cancelled by the time the error is raised
+        assert service.active == 0
+        assert service.cancelled == 3
+
+    asyncio.run(validate())
+    assert sorted(service.calls) == [1, 2, 3, 4]
+
+
+def test_aparse_falls_back_to_parse() -> None:
+    """Test that an adapter without aparse awaits to parse."""
+
+    adapter = PydanticAdapter(type=Email, parse=Email.parse, dump=str)
+    assert asyncio.run(adapter.aparse("a@example.com")) == Email("a@example.com")
@@ -0,0 +1,142 @@
+import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from pydantic_custom_type_adapter.cache import SchemaCache
+from tests.custom_types import Email, Point
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+PointDictType = Annotated[
+    Point,
+    PydanticAdapter(
+        type=Point,
+        parse="tests.custom_types.point:Point.from_dict",
+        dump="tests.custom_types.point:Point.to_dict",
+    ),
+]
+
+
+class Order(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    email: EmailType
+    position: PointDictType
+
+
+class Shipment(BaseModel):
+    position: Annotated[
+        Point,
+        PydanticAdapter(type=Point, parse=Point.from_dict, dump=lambda p: p.to_dict()),
+    ]
+
+
+ORDER_JSON = '{"email":"john@example.com","position":{"x":1.0,"y":2.0}}'
+
+
+def test_cache(tmp_path: Path) -> None:
+    """Test that schemas are saved to the cache and loaded from it."""
+
+    cache = SchemaCache(tmp_path, version="1")
+    validator, serializer = cache.load(Order)
+    order = validator.validate_json(ORDER_JSON)
+    assert order == Order(email=Email("john@example.com"), position=Point(1, 2))
+    assert serializer.to_json(order).decode() == ORDER_JSON
+
+    # A new cache over the same directory loads the saved schema
+    cache = SchemaCache(tmp_path, version="1")
+    assert cache._read(cache._path(Order)) is not None
+    validator, serializer = cache.load(Order)
+    order = validator.validate_json(ORDER_JSON)
+    assert isinstance(order, Order)
+    assert serializer.to_json(order).decode() == ORDER_JSON
+
+
+def test_stale_cache(tmp_path: Path) -> None:
+    """Test that a schema is rebuilt when a module it refers to has changed."""
+
+    cache = SchemaCache(tmp_path, version="1")
+    cache.load(Order)
+    path = cache._path(Order)
+    with open(path, "rb") as f:
+        files, data = pickle.load(f)
+    assert any(file.endswith("test_cache.py") for file in files)
+    with open(path, "wb") as f:
+        pickle.dump(({file: "stale" for file in files}, data), f)
+    assert cache._read(path) is None
+
+    validator, _ = cache.load(Order)
+    assert isinstance(validator.validate_json(ORDER_JSON), Order)
+    assert cache._read(path) is not None
+
+
+def test_uncachable(tmp_path: Path) -> None:
+    """Test that models whose schemas cannot be pickled are built without caching."""
+
+    cache = SchemaCache(tmp_path, version="1")
+    validator, serializer = cache.load(Shipment)
+    shipment = validator.validate_python({"position": {"x": 1, "y": 2}})
+    assert serializer.to_python(shipment) == {"position": {"x": 1, "y": 2}}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_version(tmp_path: Path) -> None:
+    """Test that schemas saved under another version are not loaded."""
+
+    cache = SchemaCache(tmp_path, version="1")
+    cache.load(Order)
+    assert cache._read(cache._path(Order)) is not None
+
+    cache = SchemaCache(tmp_path, version="2")
+    assert cache._read(cache._path(Order)) is None
+    validator, _ = cache.load(Order)
+    assert isinstance(validator.validate_json(ORDER_JSON), Order)
+
+
+def test_corrupt_cache(tmp_path: Path) -> None:
+    """Test that a corrupt cache entry is ignored rather than raising."""
+
+    cache = SchemaCache(tmp_path, version="1")
+    path = cache._path(Order)
+    with open(path, "wb") as f:
+        pickle.dump(42, f)
+    assert cache._read(path) is None
+    validator, _ = cache.load(Order)
+    assert isinstance(validator.validate_json(ORDER_JSON), Order)
+
+
+def test_concurrent_writes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that threads saving the same schema at once each write their own temporary file."""
+
+    errors: list[OSError] = []
+    replace = os.replace
+
+    def checked_replace(source: Path, destination: Path) -> None:
+        try:
+            replace(source, destination)
+        except OSError as e:
+            errors.append(e)
+            raise
+
+    monkeypatch.setattr(os, "replace", checked_replace)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cache = SchemaCache(tmp_path, version="1")
+    path = cache._path(Order)
+    Order.model_rebuild()
+    schema = Order.__pydantic_core_schema__
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: cache._write(path, schema), range(64)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert errors == []
+    assert cache._read(path) is not None
+    assert [file.name for file in tmp_path.iterdir()] == [path.name]
@@ -0,0 +1,282 @@
+from typing import Annotated
+
+import pytest
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    ValidationError,
+    computed_field,
+    field_serializer,
+    model_serializer,
+)
+
+from pydantic_custom_type_adapter import (
+    PydanticAdapter,
+    dump_columns,
+    validate_columns,
+)
+from tests.custom_types import Email, Point, UserId
+
+PointType = Annotated[
+    Point, PydanticAdapter(type=Point, parse=Point.from_dict, dump=Point.to_dict)
+]
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+
+class Owner(BaseModel):
+    name: str
+    email: EmailType
+
+
+class Location(BaseModel):
+    name: str
+    position: PointType
+    owner: Owner
+    tags: list[str] = []
+
+
+LOCATIONS = [
+    Location(
+        name="home",
+        position=Point(1.0, 2.0),
+        owner=Owner(name="alice", email=Email("alice@example.com")),
+        tags=["a"],
+    ),
+    Location(
+        name="work",
+        position=Point(3.0, 4.0),
+        owner=Owner(name="bob", email=Email("bob@example.com")),
+    ),
+]
+
+
+def test_dump_columns() -> None:
+    """Test that models are dumped into columns, with dicts split into sub-columns."""
+
+    assert dump_columns(LOCATIONS) == {
+        "name": ["home", "work"],
+        "position.x": [1.0, 3.0],
+        "position.y": [2.0, 4.0],
+        "owner.name": ["alice", "bob"],
+        "owner.email": ["alice@example.com", "bob@example.com"],
+        "tags": [["a"], []],
+    }
+    assert dump_columns([], Location) == {
+        "name": [],
+        "position": [],
+        "owner": [],
+        "tags": [],
+    }
+    with pytest.raises(ValueError):
+        dump_columns([])
+
+
+def test_validate_columns() -> None:
+    """Test that columns are validated back into models."""
+
+    assert validate_columns(Location, dump_columns(LOCATIONS)) == LOCATIONS
+    assert validate_columns(Location, dump_columns([], Location)) == []
+
+    # Missing columns get their defaults
+    columns = dump_columns(LOCATIONS)
+    del columns["tags"]
+    assert [location.tags for location in validate_columns(Location, columns)] == [
+        [],
+        [],
+    ]
+
+    columns = dump_columns(LOCATIONS)
+    columns["position.x"] = [1.0]
+    with pytest.raises(ValueError):
+        validate_columns(Location, columns)
+
+    columns = dump_columns(LOCATIONS)
+    columns["owner.email"] = ["alice@example.com", "invalid"]
+    with pytest.raises(ValidationError) as exc_info:
+        validate_columns(Location, columns)
+    assert exc_info.value.errors()[0]["loc"][:3] == (1, "owner", "email")
+
+
+def test_dump_columns_like_model_dump() -> None:
+    """Test that the columns hold the same keys and values as `model_dump()`."""
+
+    class Account(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True, serialize_by_alias=True)
+
+        user_id: UserId
+        name: str = Field(serialization_alias="Name")
+        email: EmailType = Field(alias="mail")
+        password: str = Field(exclude=True)
+
+        @field_serializer("name")
+        def shout(self, name: str) -> str:
+            return f"{name.upper()}!"
+
+        @computed_field
+        def domain(self) -> str:
+            return self.email.address.partition("@")[2]
+
+    accounts = [
+        Account(
+            user_id=UserId(i),
+            name=f"user{i}",
+            mail=Email(f"user{i}@example.com"),
+            password="secret",
+        )
+        for i in range(1, 3)
+    ]
+    dumps = [account.model_dump() for account in accounts]
+    assert dump_columns(accounts) == {key: [d[key] for d in dumps] for key in dumps[0]}
+    assert list(dump_columns(accounts, by_alias=False)) == [
+        "user_id",
+        "name",
+        "email",
+        "domain",
+    ]
+
+    # Values dumped by adapters are serialized like model_dump serializes them
+    class PointModel(BaseModel):
+        x: float
+        y: float
+
+    class Route(BaseModel):
+        start: Annotated[
+            Point,
+            PydanticAdapter(
+                type=Point,
+                parse=lambda d: Point(d["x"], d["y"]),
+                dump=lambda p: PointModel(x=p.x, y=p.y),
+            ),
+        ]
+        code: Annotated[
+            Email,
+            PydanticAdapter(
+                type=Email,
+                parse=Email,
+                dump=str,
+                return_type=Annotated[str, PlainSerializer(str.upper)],
+            ),
+        ]
+
+    routes = [
+        Route(start=Point(1, 2), code=Email("a@example.com")),
+        Route(start=Point(3, 4), code=Email("b@example.com")),
+    ]
+    assert dump_columns(routes) == {
+        "start.x": [1.0, 3.0],
+        "start.y": [2.0, 4.0],
+        "code": ["A@EXAMPLE.COM", "B@EXAMPLE.COM"],
+    }
+    assert routes[0].model_dump() == {
+        "start": {"x": 1.0, "y": 2.0},
+        "code": "A@EXAMPLE.COM",
+    }
+
+    class Pair(BaseModel):
+        left: int
+        right: int
+
+        @model_serializer
+        def flip(self) -> dict[str, int]:
+            return {"l": self.right, "r": self.left}
+
+    assert dump_columns([Pair(left=1, right=2), Pair(left=3, right=4)]) == {
+        "l": [2, 4],
+        "r": [1, 3],
+    }
+
+    class Value(BaseModel):
+        value: int
+
+        @model_serializer
+        def unwrap(self) -> int:
+            return self.value
+
+    with pytest.raises(ValueError):
+        dump_columns([Value(value=1)])
+
+
+def test_validate_columns_aliases() -> None:
+    """Test that columns are looked up by the keys `model_validate` accepts."""
+
+    parse_many_calls = []
+
+    def parse_many(values: list[str]) -> list[Email]:
+        parse_many_calls.append(values)
+        return [Email(value) for value in values]
+
+    class Contact(BaseModel):
+        name: str = Field(validation_alias=AliasChoices("full_name", "fullName"))
+        email: Annotated[
+            Email,
+            PydanticAdapter(type=Email, parse=Email, dump=str, parse_many=parse_many),
+        ] = Field(alias="mail")
+
+    columns = {"fullName": ["alice"], "mail": ["alice@example.com"]}
+    contacts = validate_columns(Contact, columns)
+    assert contacts == [
+        Contact.model_validate({"full_name": "alice", "mail": "alice@example.com"})
+    ]
+    assert parse_many_calls == [["alice@example.com"]]
+
+    # Names are only accepted when the model or the caller allows it
+    columns = {"name": ["alice"], "email": ["alice@example.com"]}
+    with pytest.raises(ValidationError):
+        validate_columns(Contact, columns)
+    assert validate_columns(Contact, columns, by_name=True) == contacts
+    assert len(parse_many_calls) == 2
+
+
+def test_many_functions() -> None:
+    """Test that dump_many and parse_many are called once per column."""
+
+    calls = []
+
+    def dump_many(points: list[Point]) -> list[str]:
+        calls.append("dump_many")
+        return [point.to_string() for point in points]
+
+    def parse_many(values: list[str]) -> list[Point]:
+        calls.append("parse_many")
+        if "invalid" in values:
+            raise ValueError("Invalid point")
+        return [Point.from_string(value) for value in values]
+
+    class Path(BaseModel):
+        point: Annotated[
+            Point,
+            PydanticAdapter(
+                type=Point,
+                parse=Point.from_string,
+                dump=Point.to_string,
+                parse_many=parse_many,
+                dump_many=dump_many,
+            ),
+        ]
+
+    paths = [Path(point=Point(i, i)) for i in range(3)]
+    columns = dump_columns(paths)
+    assert columns == {"point": ["0,0", "1,1", "2,2"]}
+    assert validate_columns(Path, columns) == paths
+    assert calls == ["dump_many", "parse_many"]
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate_columns(Path, {"point": ["0,0", "invalid"]})
+    assert exc_info.value.errors()[0]["loc"] == ("point",)
+
+
+def test_arrays() -> None:
+    """Test that columns are converted to NumPy arrays where possible."""
+
+    np = pytest.importorskip("numpy")
+
+    columns = dump_columns(LOCATIONS, arrays=True)
+    assert isinstance(columns["position.x"], np.ndarray)
+    assert columns["position.x"].dtype == np.float64
+    assert isinstance(columns["owner.email"], np.ndarray)
+    assert isinstance(columns["tags"], list)
+    assert validate_columns(Location, columns) == LOCATIONS
@@ -0,0 +1,128 @@
+import copy
+from typing import Annotated, Self
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_custom_type_adapter import PydanticAdapter, set_copy_policy
+
+
+class Node:
+    """A type local to these tests, since copy policies are set on the type itself."""
+
+    def __init__(self, value: str, children: list[Self] | None = None):
+        self.value = value
+        self.children = children or []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        return cls(data["value"], [cls.from_dict(c) for c in data.get("children", [])])
+
+    def to_dict(self) -> dict:
+        return {"value": self.value, "children": [c.to_dict() for c in self.children]}
+
+
+def test_immutable() -> None:
+    """Test that deep copies share instances of an immutable type."""
+
+    class Shared(Node):
+        pass
+
+    SharedType = Annotated[
+        Shared,
+        PydanticAdapter(type=Shared, parse=Shared.from_dict, dump=Shared.to_dict),
+    ]
+
+    class Tree(BaseModel):
+        root: SharedType
+        tags: list[str]
+
+    tree = Tree.model_validate(
+        {"root": {"value": "a", "children": [{"value": "b"}]}, "tags": ["x"]}
+    )
+    # Creating adapters and models does not change how the type is copied
+    assert tree.model_copy(deep=True).root is not tree.root
+
+    set_copy_policy(Shared, immutable=True)
+    copied = tree.model_copy(deep=True)
+    assert copied.root is tree.root
+    assert copied.tags == tree.tags and copied.tags is not tree.tags
+
+    # Existing instances are not revalidated
+    assert Tree(root=tree.root, tags=[]).root is tree.root
+
+
+def test_copy_function() -> None:
+    """Test that deep copies use the copy function of the type."""
+
+    class Cloned(Node):
+        pass
+
+    calls = []
+
+    def clone(node: Cloned) -> Cloned:
+        calls.append(node)
+        return Cloned(node.value, node.children)
+
+    set_copy_policy(Cloned, copy=clone)
+
+    class Tree(BaseModel):
+        root: Annotated[
+            Cloned,
+            PydanticAdapter(type=Cloned, parse=Cloned.from_dict, dump=Cloned.to_dict),
+        ]
+
+    tree = Tree.model_validate({"root": {"value": "a", "children": [{"value": "b"}]}})
+    copied = tree.model_copy(deep=True)
+    assert calls == [tree.root]
+    assert copied.root is not tree.root
+    assert copied.root.children is tree.root.children
+    assert copied.model_dump() == tree.model_dump()
+
+
+def test_subclass_copy_policy() -> None:
+    """Test that a subclass of a type with a copy policy may be given its own."""
+
+    class Shared(Node):
+        pass
+
+    class Cloned(Shared):
+        pass
+
+    set_copy_policy(Shared, immutable=True)
+    set_copy_policy(Cloned, copy=lambda node: Cloned(node.value, node.children))
+    shared, cloned = Shared("a"), Cloned("b")
+    assert copy.deepcopy(shared) is shared
+    assert copy.deepcopy(cloned) is not cloned
+    assert copy.deepcopy(cloned).value == "b"
+
+
+def test_copy_policy_conflicts() -> None:
+    """Test that conflicting copy policies are rejected."""
+
+    class Shared(Node):
+        pass
+
+    set_copy_policy(Shared, immutable=True)
+    # The same policy may be set again
+    set_copy_policy(Shared, immutable=True)
+    with pytest.raises(ValueError, match="different copy policy"):
+        set_copy_policy(Shared, copy=copy.copy)
+
+    class Copyable(Node):
+        def __deepcopy__(self, memo: dict) -> Self:
+            return self
+
+    class CopyableChild(Copyable):
+        pass
+
+    with pytest.raises(ValueError, match="defines its own"):
+        set_copy_policy(Copyable, immutable=True)
+    with pytest.raises(ValueError, match="inherits its own"):
+        set_copy_policy(CopyableChild, immutable=True)
+    with pytest.raises(ValueError):
+        set_copy_policy(int, immutable=True)
+    with pytest.raises(ValueError):
+        set_copy_policy(Node, immutable=True, copy=copy.copy)
+    with pytest.raises(ValueError):
+        set_copy_policy(Node)
@@ -132,3 +132,41 @@ def test_nesting() -> None:
     nested_data = {"user": {"email": "test@example.com"}}
     wrapper = WrapperModel.model_validate(nested_data)
     assert wrapper.user.email.address == "test@example.com"
+
+
+def test_input_type() -> None:
+    """Test that input of the wrong type is rejected before calling parse."""
+
+    calls = []
+
+    def parse(value: str) -> Email:
+        calls.append(value)
+        return Email(value)
+
+    TypedEmailType = Annotated[
+        Email,
+        PydanticAdapter(
+            type=Email, parse=parse, dump=str, input_type=str, return_type=str
+        ),
+    ]
+
+    class User(BaseModel):
+        email: TypedEmailType
+
+    with pytest.raises(ValidationError, match="Input should be a valid string"):
+        User.model_validate({"email": 123})
+    assert calls == []
+
+    user = User.model_validate_json('{"email": "john@example.com"}')
+    assert user.model_dump_json() == '{"email":"john@example.com"}'
+    assert calls == ["john@example.com"]
+
+    with pytest.raises(ValueError):
+        PydanticAdapter(
+            type=Email,
+            parse=parse,
+            dump=str,
+            parse_binary=Email,
+            dump_binary=str,
+            input_type=str,
+        )
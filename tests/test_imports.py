@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pydantic_custom_type_adapter
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing the package does not import heavy modules it may not need."""
+
+    code = (
+        "import sys\n"
+        "from pydantic import BaseModel\n"
+        "before = set(sys.modules)\n"
+        "import pydantic_custom_type_adapter\n"
+        "print(*sorted(set(sys.modules) - before))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert set(result.stdout.split()) == {
+        "pydantic_custom_type_adapter",
+        "pydantic_custom_type_adapter._adapter",
+    }
+
+
+def test_lazy_attributes() -> None:
+    """Test that lazily imported attributes are available."""
+
+    assert isinstance(pydantic_custom_type_adapter.__version__, str)
+    assert callable(pydantic_custom_type_adapter.avalidate)
+    assert callable(pydantic_custom_type_adapter.validate_many_parallel)
+    assert "avalidate_json" in dir(pydantic_custom_type_adapter)
+    for name in pydantic_custom_type_adapter.__all__:
+        assert hasattr(pydantic_custom_type_adapter, name)
@@ -0,0 +1,129 @@
+import json
+import pathlib
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from pydantic_custom_type_adapter.inspect import (
+    AdapterReport,
+    format_reports,
+    inspect_model,
+    main,
+)
+from tests.custom_types import Coordinates, Email, Point
+
+EmailType = Annotated[
+    Email,
+    PydanticAdapter(
+        type=Email, parse=Email.parse, dump=str, input_type=str, return_type=str
+    ),
+]
+
+PointDictType = Annotated[
+    Point,
+    PydanticAdapter(type=Point, parse=Point.from_dict, dump=lambda p: p.to_dict()),
+]
+
+PointStringType = Annotated[
+    Point,
+    PydanticAdapter(type=Point, parse=Point.from_string, dump=lambda p: p.to_string()),
+]
+
+CityType = Annotated[
+    Coordinates, PydanticAdapter.from_mapping({"london": Coordinates(51.5, -0.1)})
+]
+
+
+class Customer(BaseModel):
+    email: EmailType
+
+
+class Order(BaseModel):
+    customer: Customer
+    city: CityType
+    stops: list[PointDictType | PointStringType]
+
+
+SAMPLE = {
+    "customer": {"email": "a@example.com"},
+    "city": "london",
+    "stops": [{"x": 1, "y": 2}, {"x": 3, "y": 4}],
+}
+
+
+def test_inspect_model() -> None:
+    """Test that adapters are found and their callbacks counted."""
+
+    reports = inspect_model(Order, [json.dumps(SAMPLE)] * 3)
+    by_location: dict[str, list[AdapterReport]] = {}
+    for report in reports:
+        by_location.setdefault(report.location, []).append(report)
+    assert set(by_location) == {"Order.customer.email", "Order.city", "Order.stops[]"}
+
+    [email] = by_location["Order.customer.email"]
+    assert email.records == 3
+    assert (email.validations, email.validator_calls) == (3, 3)
+    assert email.serializer_calls == 3  # str calls Email.__str__
+    assert email.hints == []
+
+    [city] = by_location["Order.city"]
+    assert (city.validations, city.validator_calls, city.serializer_calls) == (3, 3, 3)
+    assert city.seconds > 0
+    assert city.hints == []
+
+    point_dict, point_string = by_location["Order.stops[]"]
+    assert point_dict.adapter._type is Point
+    assert (point_dict.validator_calls, point_dict.serializer_calls) == (6, 6)
+    assert point_dict.seconds_per_record > 0
+    assert point_string.validator_calls == 0
+    for report in (point_dict, point_string):
+        assert any("input_type" in hint for hint in report.hints)
+        assert any("return_type" in hint for hint in report.hints)
+        assert any("overlapping" in hint for hint in report.hints)
+
+    # The model itself is not affected
+    assert Order.model_validate(SAMPLE).model_dump() == SAMPLE
+
+
+def test_union_of_models() -> None:
+    """Test that adapters in models which are choices of a union are not hinted as overlapping."""
+
+    class Business(BaseModel):
+        email: EmailType
+
+    class Person(BaseModel):
+        email: EmailType
+
+    class Contact(BaseModel):
+        owner: Business | Person
+        position: PointDictType | None
+
+    reports = inspect_model(Contact)
+    assert [report.location for report in reports] == [
+        "Contact.owner.email",
+        "Contact.owner.email",
+        "Contact.position",
+    ]
+    assert not any("overlapping" in hint for r in reports for hint in r.hints)
+
+
+def test_inspect_without_samples() -> None:
+    """Test that adapters are reported even without samples."""
+
+    reports = inspect_model(Customer)
+    assert [report.location for report in reports] == ["Customer.email"]
+    assert "Customer.email: adapter for Email" in format_reports(reports)
+
+
+def test_main(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line interface."""
+
+    samples = tmp_path / "samples.jsonl"
+    samples.write_text(f"{json.dumps(SAMPLE)}\n{json.dumps(SAMPLE)}\n")
+    main(["tests.test_inspect:Order", str(samples)])
+    output = capsys.readouterr().out
+    assert "Order.stops[]: adapter for Point" in output
+    assert "2.0 validator calls" in output
+    assert "hint: No return_type" in output
@@ -0,0 +1,88 @@
+import pickle
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticSerializationError
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from tests.custom_types import Coordinates, Point
+
+CITIES = {
+    "london": Coordinates(51.5072, -0.1276),
+    "paris": Coordinates(48.8566, 2.3522),
+    "tokyo": Coordinates(35.6764, 139.65),
+}
+
+CityType = Annotated[Coordinates, PydanticAdapter.from_mapping(CITIES)]
+
+
+def test_from_mapping() -> None:
+    """Test an adapter for a finite set of values."""
+
+    class Trip(BaseModel):
+        origin: CityType
+        destination: CityType
+
+    trip = Trip.model_validate_json('{"origin": "london", "destination": "tokyo"}')
+    assert trip.origin is CITIES["london"]
+    assert trip.destination is CITIES["tokyo"]
+    assert trip.model_dump() == {"origin": "london", "destination": "tokyo"}
+
+    # Instances are accepted, and equal ones are replaced by those of the mapping
+    trip = Trip(origin=CITIES["paris"], destination=Coordinates(51.5072, -0.1276))
+    assert trip.origin is CITIES["paris"]
+    assert trip.destination is CITIES["london"]
+    assert trip.model_dump_json() == '{"origin":"paris","destination":"london"}'
+
+    # Only the instances of the mapping are dumped, even if others are equal to them
+    trip = Trip.model_construct(
+        origin=Coordinates(51.5072, -0.1276), destination=CITIES["tokyo"]
+    )
+    with pytest.raises(PydanticSerializationError, match="not one of the instances"):
+        trip.model_dump()
+
+
+def test_from_mapping_errors() -> None:
+    """Test that invalid values report the allowed values."""
+
+    class Trip(BaseModel):
+        origin: CityType
+
+    with pytest.raises(ValidationError) as exc_info:
+        Trip.model_validate({"origin": "berlin"})
+    assert "Input should be 'london', 'paris' or 'tokyo'" in str(exc_info.value)
+
+    with pytest.raises(ValidationError):
+        Trip.model_validate({"origin": Coordinates(0, 0)})
+
+    with pytest.raises(ValueError):
+        PydanticAdapter.from_mapping({})
+    with pytest.raises(ValueError):
+        PydanticAdapter.from_mapping({"a": Point(0, 0), "b": Coordinates(0, 0)})
+
+
+def test_from_mapping_unhashable() -> None:
+    """Test a mapping to unhashable instances, which are dumped by identity."""
+
+    corners = {1: Point(0, 0), 2: Point(0, 1), 3: Point(1, 1), 4: Point(1, 0)}
+
+    class Square(BaseModel):
+        corner: Annotated[Point, PydanticAdapter.from_mapping(corners, type=Point)]
+
+    square = Square.model_validate_json('{"corner": 3}')
+    assert square.corner is corners[3]
+    assert square.model_dump() == {"corner": 3}
+
+
+def test_from_mapping_pickle() -> None:
+    """Test that mapping adapters can be pickled."""
+
+    restored = pickle.loads(pickle.dumps(PydanticAdapter.from_mapping(CITIES)))
+
+    class Trip(BaseModel):
+        origin: Annotated[Coordinates, restored]
+
+    trip = Trip.model_validate({"origin": "paris"})
+    assert trip.origin == CITIES["paris"]
+    assert trip.model_dump() == {"origin": "paris"}
@@ -0,0 +1,117 @@
+import datetime
+import struct
+import uuid
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+pytest.importorskip("msgpack")
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from pydantic_custom_type_adapter.msgpack import dump_msgpack, validate_msgpack
+from tests.custom_types import Email, Point, Timestamp
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+PointType = Annotated[
+    Point,
+    PydanticAdapter(
+        type=Point,
+        parse=Point.from_dict,
+        dump=lambda p: p.to_dict(),
+        parse_binary=lambda b: Point(*struct.unpack("<2d", b)),
+        dump_binary=lambda p: struct.pack("<2d", p.x, p.y),
+    ),
+]
+
+TimestampType = Annotated[
+    Timestamp,
+    PydanticAdapter(
+        type=Timestamp,
+        parse=Timestamp.parse,
+        dump=lambda ts: ts.to_dict(),
+        parse_binary=Timestamp,
+        dump_binary=lambda ts: ts.datetime,
+    ),
+]
+
+
+class Event(BaseModel):
+    id: uuid.UUID
+    email: EmailType
+    position: PointType
+    timestamp: TimestampType
+    counts: dict[int, int]
+
+
+def test_msgpack_round_trip(test_uuid: uuid.UUID, utc_now: datetime.datetime) -> None:
+    """Test that models round-trip through MessagePack."""
+
+    event = Event(
+        id=test_uuid,
+        email=Email("test@example.com"),
+        position=Point(1.5, -2.5),
+        timestamp=Timestamp(utc_now),
+        counts={1: 2},
+    )
+    data = dump_msgpack(event)
+    assert isinstance(data, bytes)
+    assert struct.pack("<2d", 1.5, -2.5) in data
+
+    restored = validate_msgpack(Event, data)
+    assert restored == event
+
+    # JSON is unaffected by the binary representation
+    assert event.model_dump()["position"] == {"x": 1.5, "y": -2.5}
+
+
+def test_msgpack_validation_errors(test_uuid: uuid.UUID) -> None:
+    """Test that invalid MessagePack data raises validation errors."""
+
+    import msgpack
+
+    data = msgpack.packb(
+        {
+            "id": str(test_uuid),
+            "email": "invalid",
+            "position": struct.pack("<2d", 0, 0),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc),
+            "counts": {},
+        },
+        datetime=True,
+    )
+    with pytest.raises(ValidationError, match="Invalid email address"):
+        validate_msgpack(Event, data)
+
+
+def test_binary_functions_required_together() -> None:
+    """Test that parse_binary and dump_binary must be given together."""
+
+    with pytest.raises(ValueError):
+        PydanticAdapter(
+            type=Point,
+            parse=Point.from_dict,
+            dump=Point.to_dict,
+            parse_binary=Point.from_dict,
+        )
+
+
+def test_strict_models() -> None:
+    """Test that strict models only round-trip values stored in their JSON-compatible form when validated with strict=False."""
+
+    class Token(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        id: uuid.UUID
+        created: datetime.datetime
+
+    token = Token(
+        id=uuid.uuid4(),
+        created=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    data = dump_msgpack(token)
+    assert Token.model_validate_json(token.model_dump_json()) == token
+    with pytest.raises(ValidationError, match="instance of UUID"):
+        validate_msgpack(Token, data)
+    assert validate_msgpack(Token, data, strict=False) == token
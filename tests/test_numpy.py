@@ -0,0 +1,152 @@
+import pickle
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from pydantic_custom_type_adapter.numpy import NDArrayAdapter
+
+
+@pytest.mark.parametrize("format", ["list", "base64", "flat"])
+def test_round_trip(format: str) -> None:
+    """Test that arrays round-trip through JSON in every format."""
+
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(dtype=np.float32, format=format)]
+
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    sample = Sample(values=array)
+    assert sample.values is array
+
+    restored = Sample.model_validate_json(sample.model_dump_json())
+    assert restored.values.dtype == np.float32
+    np.testing.assert_array_equal(restored.values, array)
+
+
+def test_json_formats() -> None:
+    """Test the JSON representation of each format."""
+
+    array = np.array([[1, 2], [3, 4]], dtype="<i4")
+
+    class Sample(BaseModel):
+        list_values: Annotated[np.ndarray, NDArrayAdapter(format="list")]
+        base64_values: Annotated[np.ndarray, NDArrayAdapter(format="base64")]
+        flat_values: Annotated[np.ndarray, NDArrayAdapter(format="flat")]
+
+    sample = Sample(list_values=array, base64_values=array, flat_values=array)
+    assert sample.model_dump() == {
+        "list_values": [[1, 2], [3, 4]],
+        "base64_values": {
+            "data": "AQAAAAIAAAADAAAABAAAAA==",
+            "dtype": "<i4",
+            "shape": [2, 2],
+        },
+        "flat_values": {"data": [1, 2, 3, 4], "shape": [2, 2]},
+    }
+
+
+def test_base64_zero_copy() -> None:
+    """Test that base64 arrays share the memory of bytes-like input."""
+
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(format="base64")]
+
+    buffer = bytearray(np.arange(4, dtype="<f8").tobytes())
+    sample = Sample.model_validate(
+        {"values": {"data": buffer, "dtype": "<f8", "shape": [4]}}
+    )
+    buffer[:8] = np.float64(42).tobytes()
+    assert sample.values[0] == 42
+
+
+def test_dtype_and_shape_checks() -> None:
+    """Test that arrays of the wrong dtype or shape are rejected."""
+
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(dtype=np.float64, shape=(None, 2))]
+
+    # Integers are cast to floats
+    sample = Sample.model_validate({"values": [[1, 2], [3, 4]]})
+    assert sample.values.dtype == np.float64
+
+    with pytest.raises(ValidationError, match="shape"):
+        Sample.model_validate({"values": [1, 2, 3]})
+    with pytest.raises(ValidationError, match="shape"):
+        Sample(values=np.zeros((2, 3)))
+    with pytest.raises(ValidationError, match="Expected an array of float64"):
+        Sample.model_validate({"values": [["a", "b"]]})
+    with pytest.raises(ValidationError):
+        Sample.model_validate({"values": [[1, 2], [3]]})
+
+    class IntSample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(dtype=np.int64)]
+
+    with pytest.raises(ValidationError, match="Expected an array of int64"):
+        IntSample.model_validate({"values": [1.5, 2.5]})
+
+    class Base64Sample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(format="base64")]
+
+    with pytest.raises(ValidationError):
+        Base64Sample.model_validate({"values": {"data": "AQAAAA==", "dtype": "<i4"}})
+    with pytest.raises(ValidationError):
+        Base64Sample.model_validate(
+            {"values": {"data": "AQAAAA==", "dtype": "<i4", "shape": [2]}}
+        )
+
+
+@pytest.mark.parametrize("format", ["list", "flat"])
+@pytest.mark.parametrize("dtype", ["uint8", "int8", "uint16", "float32"])
+def test_narrow_dtypes(format: str, dtype: str) -> None:
+    """Test that narrow and unsigned dtypes round-trip through the JSON formats."""
+
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, NDArrayAdapter(dtype=dtype, format=format)]
+
+    array = np.array([[0, 1], [2, 100]], dtype=dtype)
+    restored = Sample.model_validate_json(Sample(values=array).model_dump_json())
+    assert restored.values.dtype == np.dtype(dtype)
+    np.testing.assert_array_equal(restored.values, array)
+
+
+def test_overflow() -> None:
+    """Test that values out of the range of the dtype are rejected."""
+
+    class Sample(BaseModel):
+        int8: Annotated[np.ndarray, NDArrayAdapter(dtype=np.int8)]
+        uint8: Annotated[np.ndarray, NDArrayAdapter(dtype=np.uint8, format="flat")]
+        float32: Annotated[np.ndarray, NDArrayAdapter(dtype=np.float32)]
+
+    valid = {
+        "int8": [-128, 127],
+        "uint8": {"data": [0, 255], "shape": [2]},
+        "float32": [1e30, float("inf")],
+    }
+    sample = Sample.model_validate(valid)
+    assert sample.float32[1] == np.inf
+
+    for field, values in [
+        ("int8", [300, -200]),
+        ("uint8", {"data": [-1, 2], "shape": [2]}),
+        ("float32", [1e300]),
+    ]:
+        with pytest.raises(ValidationError, match="out of range"):
+            Sample.model_validate({**valid, field: values})
+
+
+def test_pickle() -> None:
+    """Test that array adapters can be pickled."""
+
+    adapter = NDArrayAdapter(dtype=np.int16, shape=(2,), format="flat")
+    restored = pickle.loads(pickle.dumps(adapter))
+
+    class Sample(BaseModel):
+        values: Annotated[np.ndarray, restored]
+
+    sample = Sample.model_validate({"values": {"data": [1, 2], "shape": [2]}})
+    assert sample.values.dtype == np.int16
+    assert sample.model_dump() == {"values": {"data": [1, 2], "shape": [2]}}
@@ -0,0 +1,87 @@
+import pickle
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_custom_type_adapter import PydanticAdapter, validate_many_parallel
+from tests.custom_types import Email, Point
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+PointDictType = Annotated[
+    Point,
+    PydanticAdapter(
+        type=Point,
+        parse="tests.custom_types.point:Point.from_dict",
+        dump="tests.custom_types.point.Point.to_dict",
+    ),
+]
+
+
+class User(BaseModel):
+    email: EmailType
+    position: PointDictType
+
+
+def test_import_paths() -> None:
+    """Test that parse and dump can be given as import paths."""
+
+    user = User.model_validate(
+        {"email": "john@example.com", "position": {"x": 1, "y": 2}}
+    )
+    assert user.position == Point(1, 2)
+    assert user.model_dump() == {
+        "email": "john@example.com",
+        "position": {"x": 1, "y": 2},
+    }
+
+    with pytest.raises(ImportError):
+        PydanticAdapter(type=Point, parse="tests.custom_types.nope.parse", dump=str)
+
+
+def test_pickle_adapter() -> None:
+    """Test that adapters round-trip through pickle."""
+
+    adapter: PydanticAdapter[Point, dict[str, float]] = PydanticAdapter(
+        type=Point,
+        parse="tests.custom_types.point:Point.from_dict",
+        dump="tests.custom_types.point:Point.to_dict",
+    )
+    restored = pickle.loads(pickle.dumps(adapter))
+
+    class Location(BaseModel):
+        position: Annotated[Point, restored]
+
+    location = Location.model_validate({"position": {"x": 1.5, "y": 2.5}})
+    assert location.position == Point(1.5, 2.5)
+    assert location.model_dump() == {"position": {"x": 1.5, "y": 2.5}}
+
+    lambda_adapter = PydanticAdapter(
+        type=Point, parse=Point.from_dict, dump=lambda p: p.to_dict()
+    )
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(lambda_adapter)
+
+
+def test_validate_many_parallel() -> None:
+    """Test validating a batch of payloads across processes."""
+
+    payloads = [
+        f'{{"email": "user{i}@example.com", "position": {{"x": {i}, "y": 0}}}}'
+        for i in range(25)
+    ]
+    users = validate_many_parallel(User, payloads, workers=2, chunk_size=4)
+    assert [user.email for user in users] == [
+        Email(f"user{i}@example.com") for i in range(25)
+    ]
+    assert [user.position for user in users] == [Point(i, 0) for i in range(25)]
+
+    assert validate_many_parallel(User, [], workers=2) == []
+
+    with pytest.raises(ValidationError):
+        validate_many_parallel(
+            User,
+            [*payloads, '{"email": "invalid", "position": {"x": 0, "y": 0}}'],
+            workers=2,
+        )
@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from pydantic_custom_type_adapter import PydanticAdapter
+from tests.custom_types import Email, Point, UserId
+
+EmailType = Annotated[Email, PydanticAdapter(type=Email, parse=Email.parse, dump=str)]
+
+UserIdType = Annotated[
+    UserId, PydanticAdapter(type=UserId, parse=UserId.parse, dump=lambda uid: uid.id)
+]
+
+PointDictType = Annotated[
+    Point,
+    PydanticAdapter(type=Point, parse=Point.from_dict, dump=lambda p: p.to_dict()),
+]
+
+
+def test_concurrent_validation_and_serialization() -> None:
+    """Test that one adapter can be used from many threads at once."""
+
+    class User(BaseModel):
+        id: UserIdType
+        email: EmailType
+        position: PointDictType
+
+    def round_trip(i: int) -> str:
+        json_data = (
+            f'{{"id": {i + 1}, "email": "user{i}@example.com",'
+            f' "position": {{"x": {i}, "y": {-i}}}}}'
+        )
+        user = User.model_validate_json(json_data)
+        assert user.id == UserId(i + 1)
+        assert user.position == Point(i, -i)
+        return user.model_dump_json()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(round_trip, range(1000)))
+
+    assert results == [
+        f'{{"id":{i + 1},"email":"user{i}@example.com",'
+        f'"position":{{"x":{i},"y":{-i}}}}}'
+        for i in range(1000)
+    ]
@@ -0,0 +1,174 @@
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic.dataclasses import dataclass
+
+from pydantic_custom_type_adapter import (
+    PydanticAdapter,
+    validate_trusted,
+    validate_trusted_json,
+)
+from tests.custom_types import Email, Point, SafeString
+
+EmailType = Annotated[
+    Email,
+    PydanticAdapter(type=Email, parse=Email.parse, dump=str, construct=Email.unchecked),
+]
+
+SafeStringType = Annotated[
+    SafeString,
+    PydanticAdapter(
+        type=SafeString,
+        parse=SafeString.parse,
+        dump=lambda s: s.value,
+        construct=SafeString.unchecked,
+    ),
+]
+
+
+class Account(BaseModel):
+    username: SafeStringType
+    email: EmailType
+
+
+class Team(BaseModel):
+    owner: Account
+    members: list[Account]
+    position: Annotated[
+        Point, PydanticAdapter(type=Point, parse=Point.from_dict, dump=Point.to_dict)
+    ]
+
+
+def test_validate_trusted() -> None:
+    """Test that construct is used instead of parse only for trusted validation."""
+
+    json_data = '{"username": "user@123!", "email": "invalid"}'
+
+    # Untrusted input is validated
+    with pytest.raises(ValidationError):
+        Account.model_validate_json(json_data)
+
+    # Trusted input skips the checks in __init__
+    account = validate_trusted_json(Account, json_data)
+    assert type(account) is Account
+    assert account.username.value == "user@123!"
+    assert account.email.address == "invalid"
+
+    # Trusted valid input round-trips
+    json_data = '{"username":"user123","email":"user@example.com"}'
+    account = validate_trusted_json(Account, json_data)
+    assert account == Account(
+        username=SafeString("user123"), email=Email("user@example.com")
+    )
+    assert account.model_dump_json() == json_data
+
+    # The model's own validation is unaffected
+    with pytest.raises(ValidationError):
+        Account.model_validate({"username": "user@123!", "email": "invalid"})
+
+
+def test_validate_trusted_nested() -> None:
+    """Test that trusted validation reaches adapters in nested models, and keeps the rest of the checks."""
+
+    data = {
+        "owner": {"username": "user@123!", "email": "invalid"},
+        "members": [{"username": "a b", "email": "b"}],
+        "position": {"x": 1, "y": 2},
+    }
+    team = validate_trusted(Team, data)
+    assert type(team.owner) is Account
+    assert type(team.members[0]) is Account
+    assert team.owner.email.address == "invalid"
+    assert team.members[0].username.value == "a b"
+    assert team.position == Point(1, 2)
+    assert team == Team(owner=team.owner, members=team.members, position=Point(1, 2))
+
+    # Adapters without construct still parse their input
+    with pytest.raises(ValidationError):
+        validate_trusted(Team, {**data, "position": {"x": 1}})
+    with pytest.raises(ValidationError):
+        validate_trusted(Team, {**data, "members": None})
+
+    # Instances are passed through
+    email = Email("user@example.com")
+    account = validate_trusted(Account, {"username": "user", "email": email})
+    assert account.email is email
+
+
+@dataclass
+class Contact:
+    email: EmailType
+
+
+class Directory(BaseModel):
+    contact: Contact
+
+
+class StrictAccount(Account):
+    model_config = ConfigDict(revalidate_instances="always")
+
+
+def test_validate_trusted_instances() -> None:
+    """Test that instances of models and dataclasses are accepted like `model_validate` accepts them."""
+
+    account = Account(username=SafeString("user"), email=Email("user@example.com"))
+    assert validate_trusted(Account, account) is account
+
+    team = validate_trusted(
+        Team, {"owner": account, "members": [account], "position": {"x": 1, "y": 2}}
+    )
+    assert team.owner is account
+    assert team.members[0] is account
+
+    contact = Contact(email=Email("user@example.com"))
+    assert validate_trusted(Directory, {"contact": contact}).contact is contact
+
+    # Instances are revalidated when the model asks for it, into the original class
+    strict = StrictAccount(username=SafeString("user"), email=Email("a@example.com"))
+    revalidated = validate_trusted(StrictAccount, strict)
+    assert revalidated is not strict
+    assert type(revalidated) is StrictAccount
+    assert revalidated == strict
+
+    # Errors are titled after the model
+    data = {"owner": 1, "members": [], "position": {"x": 1}}
+    with pytest.raises(ValidationError) as trusted_info:
+        validate_trusted(Team, data)
+    with pytest.raises(ValidationError) as exc_info:
+        Team.model_validate(data)
+    assert trusted_info.value.title == "Team"
+    assert trusted_info.value.errors(include_context=False) == exc_info.value.errors(
+        include_context=False
+    )
+
+
+def test_trusted_adapter() -> None:
+    """Test that a trusted adapter always uses construct."""
+
+    TrustedEmailType = Annotated[
+        Email,
+        PydanticAdapter(
+            type=Email,
+            parse=Email.parse,
+            dump=str,
+            construct=Email.unchecked,
+            trusted=True,
+        ),
+    ]
+
+    class User(BaseModel):
+        email: TrustedEmailType
+
+    user = User.model_validate({"email": "invalid"})
+    assert user.email.address == "invalid"
+
+    email = Email("user@example.com")
+    assert User(email=email).email is email
+
+
+def test_trusted_requires_construct() -> None:
+    """Test that a trusted adapter must be given a construct function."""
+
+    with pytest.raises(ValueError):
+        PydanticAdapter(type=Email, parse=Email.parse, dump=str, trusted=True)